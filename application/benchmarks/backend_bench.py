@@ -0,0 +1,52 @@
+from bench_utils import *
+from utils.config_utils import *
+from utils.graph_utils import *
+from utils.solve_utils import *
+import importlib
+
+
+def get_gap(solution):
+    """
+    Return relative gap (%) between objective value and bound, 0 if solved to optimality
+    """
+    if solution['status'] == 'Optimal':
+        return 0.0
+    if 'obj_val' not in solution:
+        return float('nan')
+
+    return abs(solution['obj_bound'] - solution['obj_val']) / abs(solution['obj_val']) * 100
+
+
+def main():
+    config = get_config(3)
+    config.update({'R_var': -0.02, 'time_limit': 60})
+    threshold, delta = 0.5, 0.2
+
+    # Skip backends not installed
+    backends = []
+    for backend in ['gurobi', 'highs']:
+        try:
+            importlib.import_module(f"utils.{backend}_utils")
+            backends.append(backend)
+        except ImportError:
+            print(f"Skipping {backend}, not installed")
+
+    print(f"{'Assets':>8} {'Days':>6} {'Backend':>8} {'Build (s)':>10} {'Solve (s)':>10} {'ObjVal':>10} {'Gap (%)':>8} {'Status':>8}")
+    for n, total_days in [(20, 60), (40, 120), (60, 250), (100, 250)]:
+        instance = get_synthetic_instance(n, total_days)
+        _, G2 = get_correlation_power_graph(instance, threshold)
+
+        for backend in backends:
+            _, solution = time_solve(G2, instance, config, delta, backend=backend)
+            build_runtime = solution['telemetry']['builds'][0]['build_time']
+            solve_runtime = solution['telemetry']['solves'][0]['runtime']
+            obj_val = f"{solution['obj_val']:.6f}" if 'obj_val' in solution else "-"
+
+            print(
+                f"{n:>8} {total_days:>6} {backend:>8} {build_runtime:>10.3f} {solve_runtime:>10.3f} "
+                f"{obj_val:>10} {get_gap(solution):>8.2f} {solution['status']:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,74 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.instance_utils import *
+from utils.solve_utils import *
+import numpy as np
+import time
+
+
+def get_synthetic_returns(n, total_days=250, market_corr=0.2, sector_corr=0.3, num_sectors=10, seed=0):
+    """
+    Return daily returns (days x assets) from a market and sector factor model, assets of one sector
+    have correlation market_corr + sector_corr and assets of different sectors market_corr
+    """
+    rng = np.random.default_rng(seed)
+    sectors = rng.integers(num_sectors, size=n)
+    market = rng.normal(0, 1, (total_days, 1))
+    sector_factors = rng.normal(0, 1, (total_days, num_sectors))
+    noise = rng.normal(0, 1, (total_days, n))
+
+    # Unit variance shocks scaled by asset volatility around asset drift
+    shocks = np.sqrt(market_corr) * market + np.sqrt(sector_corr) * sector_factors[:, sectors] + np.sqrt(1 - market_corr - sector_corr) * noise
+    volatility = rng.uniform(0.01, 0.03, n)
+    drift = rng.normal(0.0005, 0.001, n)
+
+    return drift + volatility * shocks
+
+
+def get_synthetic_prices_dict(n, total_days=250, num_partitions=1, seed=0, **factor_params):
+    """
+    Return prices dictionary of Dataset layout with n assets per partition from the factor model,
+    input of get_instances
+    """
+    daily_returns = get_synthetic_returns(n * num_partitions, total_days, seed=seed, **factor_params)
+    prices = 100 * np.cumprod(np.vstack([np.ones(n * num_partitions), 1 + daily_returns]), axis=0)
+
+    return {'synthetic': {
+        f"{k*n} - {(k+1)*n-1}": [[f"A{i}" for i in range(k*n, (k+1)*n)], prices[:, k*n:(k+1)*n]]
+        for k in range(num_partitions)
+    }}
+
+
+def time_function(fn, *args, repeat=1):
+    """
+    Return best runtime over repeats and last output of function
+    """
+    runtimes = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        output = fn(*args)
+        runtimes.append(time.perf_counter() - start_time)
+
+    return min(runtimes), output
+
+
+def time_solve(G, instance, config, delta, **overrides):
+    """
+    Return runtime and solution of solve_max_return for a single model, without cache, presolve,
+    iterative warmstart or heuristic start unless overridden, build and solve times are in its telemetry
+    """
+    config = {
+        **config, 'cache_size': 0, 'presolve': False, 'iterative_warmstart': False, 'heuristic_start': False,
+        'telemetry': True, **overrides
+    }
+
+    return time_function(solve_max_return, G, [], instance, config, {'save_log': False}, delta)
+
+
+def get_synthetic_instance(n, total_days=250, seed=0):
+    """
+    Return instance built by get_instances from synthetic prices
+    """
+    return get_instances(get_synthetic_prices_dict(n, total_days, seed=seed))['synthetic'][f"0 - {n-1}"]
@@ -0,0 +1,33 @@
+from bench_utils import *
+from utils.graph_utils import *
+from itertools import islice
+
+
+def enumerate_cliques(G2, max_cliques):
+    """
+    Previous path: all maximal cliques, stopped after max_cliques + 1 to keep runtime bounded
+    """
+    return list(islice(nx.find_cliques(G2.to_networkx()), max_cliques + 1))
+
+
+def main():
+    max_cliques = 100000
+
+    print(f"{'Assets':>8} {'Threshold':>10} {'Edges':>8} {'Cliques':>8} {'Cover':>8} {'Enumerate (s)':>14} {'Cover (s)':>10}")
+    for n in [100, 500]:
+        instance = get_synthetic_instance(n)
+        graphs = get_correlation_power_graphs(instance, [0.3, 0.5, 0.7])
+
+        for t, (_, G2) in sorted(graphs.items()):
+            enumerate_runtime, cliques = time_function(enumerate_cliques, G2, max_cliques)
+            cover_runtime, cover = time_function(get_edge_clique_cover, G2)
+            num_cliques = len(cliques) if len(cliques) <= max_cliques else f">{max_cliques}"
+
+            print(
+                f"{n:>8} {t:>10} {G2.number_of_edges():>8} {num_cliques:>8} {len(cover):>8} "
+                f"{enumerate_runtime:>14.4f} {cover_runtime:>10.4f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
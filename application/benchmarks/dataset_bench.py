@@ -0,0 +1,45 @@
+from bench_utils import *
+from utils.config_utils import *
+from classes.Dataset import *
+import tempfile
+import os
+
+
+def write_synthetic_dataset(n, date_range):
+    """
+    Write synthetic 'l' dataset (tickers and stock prices of business days in date range) in current folder
+    """
+    path = "datasets/yahoo_finance/l"
+    os.makedirs(path, exist_ok=True)
+
+    tickers = [f"A{i}" for i in range(n)]
+    dates = pd.bdate_range(date_range[0], date_range[1], inclusive='left')
+    prices = 100 * np.cumprod(np.vstack([np.ones(n), 1 + get_synthetic_returns(n, len(dates) - 1)]), axis=0)
+
+    pd.DataFrame({'STOCKS': tickers}).to_excel(path + "/tickers.xlsx", index=False)
+    pd.DataFrame(prices, index=dates, columns=tickers).to_csv(path + "/stocks.csv")
+
+
+def main():
+    config = get_config(1)
+    os.chdir(tempfile.mkdtemp())
+    write_synthetic_dataset(config['assets']['range'] * config['assets']['#partitions'], config['date_range'])
+
+    # Startup reading csv once per partition
+    def read_csv_partitions():
+        return [
+            pd.read_csv("datasets/yahoo_finance/l/stocks.csv", index_col=0, parse_dates=True).iloc[:, k * 500:(k + 1) * 500]
+            for k in range(config['assets']['#partitions'])
+        ]
+    csv_runtime, _ = time_function(read_csv_partitions)
+
+    # Startup converting csv to npy cache, then loading from cache
+    cold_runtime, _ = time_function(Dataset, config)
+    warm_runtime, _ = time_function(Dataset, config, repeat=3)
+
+    print(f"{'Csv per partition (s)':>22} {'Cold cache (s)':>15} {'Warm cache (s)':>15}")
+    print(f"{csv_runtime:>22.3f} {cold_runtime:>15.3f} {warm_runtime:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+from bench_utils import *
+from classes.Instance import *
+from utils.config_utils import *
+from utils.graph_utils import *
+from utils.solve_utils import *
+import sys
+
+
+def get_repeated_days_instance():
+    """
+    Return instance of 2 anti-correlated assets with each day repeated, equality c2 needs only some
+    of the repeated days as "bad days"
+    """
+    instance = Instance(["A0", "A1"], np.ones((5, 2)))
+    instance.daily_returns = np.array([[0.03, -0.02], [0.03, -0.02], [-0.02, 0.03], [-0.02, 0.03]])
+
+    return instance
+
+
+def main():
+    config = get_config(3)
+    config.update({'time_limit': 60})
+
+    # Repeated days case, small synthetic instances with rounded returns, so some days are identical,
+    # and unrounded ones, where days are only ordered by dominance
+    cases = [("repeated days", get_repeated_days_instance(), 0.5, 0.01, 0.75)]
+    for seed in range(3):
+        instance = get_synthetic_instance(4, total_days=60, seed=seed)
+        instance.daily_returns = np.round(instance.daily_returns, 2)
+        cases.append((f"synthetic {seed}", instance, 0.5, 0.0, 0.5))
+    for seed in range(3):
+        cases.append((f"dominance {seed}", get_synthetic_instance(5, total_days=40, seed=seed), 0.5, 0.0, 0.5))
+
+    mismatches = 0
+    print(f"{'Instance':>14} {'c2':>11} {'Eliminated':>11} {'Status':>16} {'ObjVal':>21} {'Runtime (s)':>12}")
+    for name, instance, threshold, R_var, delta in cases:
+        _, G2 = get_correlation_power_graphs(instance, [threshold])[threshold]
+
+        for delta_constr in ['inequality', 'equality']:
+            config.update({'R_var': R_var, 'delta_constr': delta_constr})
+            runtime, solution = time_solve(G2, instance, config, delta, day_reduction=False)
+            reduced_runtime, reduced_solution = time_solve(G2, instance, config, delta, day_reduction=True)
+            eliminated_days = sum(reduced_solution.get('day_reduction', {}).values())
+
+            # Reduction must not change status or objective value
+            obj_vals = [s.get('obj_val', float('nan')) for s in [solution, reduced_solution]]
+            if solution['status'] != reduced_solution['status'] or not np.allclose(*obj_vals, equal_nan=True):
+                mismatches += 1
+
+            print(
+                f"{name:>14} {delta_constr:>11} {eliminated_days:>11} {solution['status'] + '/' + reduced_solution['status']:>16} "
+                f"{obj_vals[0]:>10.6f}/{obj_vals[1]:>10.6f} {runtime:>5.2f}/{reduced_runtime:>5.2f}"
+            )
+
+    if mismatches:
+        print(f"{mismatches} cases changed by day reduction")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,41 @@
+from bench_utils import *
+from utils.config_utils import *
+from utils.graph_utils import *
+from utils.solve_utils import *
+
+
+def solve_points(G, instance, config, deltas, R_vars):
+    """
+    Solve every grid point independently with solve_max_return
+    """
+    flags = {'save_log': False}
+
+    return {
+        (delta, R_var): solve_max_return(G, [], instance, {**config, 'R_var': R_var}, flags, delta)
+        for R_var in R_vars for delta in deltas
+    }
+
+
+def main():
+    config = get_config(3)
+    config.update({'time_limit': 60, 'cache_size': 0})
+    deltas, R_vars = [0.1, 0.15, 0.2, 0.25, 0.3], [-0.03, -0.025, -0.02, -0.015, -0.01]
+
+    print(f"{'Assets':>8} {'Threshold':>10} {'Mode':>12} {'#Solves':>8} {'Runtime (s)':>12} {'Max ObjVal Dif':>15}")
+    for n in [100, 200]:
+        instance = get_synthetic_instance(n)
+
+        for t in [0.3, 0.5]:
+            _, G2 = get_correlation_power_graph(instance, t)
+            points_runtime, points = time_function(solve_points, G2, instance, config, deltas, R_vars)
+            frontier_runtime, frontier = time_function(solve_frontier, G2, [], instance, config, {'save_log': False}, deltas, R_vars)
+
+            # Objective values of independent and frontier solves should agree
+            dif = max(abs(points[key].get('obj_val', 0) - frontier[key].get('obj_val', 0)) for key in points)
+            for mode, runtime, solutions in [("independent", points_runtime, points), ("frontier", frontier_runtime, frontier)]:
+                num_solves = sum(len(s['telemetry']['solves']) for s in solutions.values())
+                print(f"{n:>8} {t:>10} {mode:>12} {num_solves:>8} {runtime:>12.3f} {dif:>15.2e}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
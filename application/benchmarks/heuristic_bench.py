@@ -0,0 +1,37 @@
+from bench_utils import *
+from utils.config_utils import *
+from utils.instance_utils import *
+from utils.graph_utils import *
+from utils.heuristic_utils import *
+
+
+def main():
+    config = get_config(3)
+    config.update({'R_var': -0.01, 'time_limit': 60})
+    fix_assets = {'num': 10, 'constr': 'equality'}
+
+    print(f"{'Assets':>8} {'Threshold':>10} {'Delta':>6} {'Heuristic':>10} {'Optimal':>10} {'Heuristic (s)':>14} {'k=10 (s)':>9}")
+    for n in [100, 500, 1000]:
+        # Correlated factor model returns
+        instance = get_synthetic_instance(n)
+
+        for t in [0.3, 0.5]:
+            _, G2 = get_correlation_power_graphs(instance, [t])[t]
+
+            for delta in [0.05, 0.2]:
+                runtime, heuristic_solution = time_function(get_heuristic_solution, G2, [], instance, config, delta)
+                fixed_runtime, _ = time_function(get_heuristic_solution, G2, [], instance, config, delta, fix_assets)
+
+                # Solve model without start, skipped if it exceeds solver limits
+                try:
+                    _, solution = time_solve(G2, instance, config, delta)
+                except Exception:
+                    solution = {}
+                heuristic_val = f"{heuristic_solution['obj_val']:.6f}" if heuristic_solution else "-"
+                obj_val = f"{solution['obj_val']:.6f}" if 'obj_val' in solution else "-"
+
+                print(f"{n:>8} {t:>10} {delta:>6} {heuristic_val:>10} {obj_val:>10} {runtime:>14.4f} {fixed_runtime:>9.4f}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,26 @@
+from bench_utils import *
+from utils.instance_utils import *
+import tracemalloc
+
+
+def main():
+    total_days = 250
+
+    print(f"{'Assets':>8} {'Dtype':>8} {'Build (s)':>10} {'Statistics (s)':>15} {'Peak memory (MB)':>17}")
+    for n, dtype in [(500, 'float64'), (5000, 'float64'), (5000, 'float32')]:
+        daily_returns = get_synthetic_returns(n, total_days)
+        prices = 100 * np.cumprod(np.vstack([np.ones(n), 1 + daily_returns]), axis=0)
+        prices_dict = {'synthetic': {f"0 - {n-1}": [[f"A{i}" for i in range(n)], prices]}}
+
+        tracemalloc.start()
+        runtime, instances = time_function(get_instances, prices_dict, dtype)
+        instance = instances['synthetic'][f"0 - {n-1}"]
+        statistics_runtime, _ = time_function(lambda: (instance.correlation_matrix, instance.sigma))
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"{n:>8} {dtype:>8} {runtime:>10.3f} {statistics_runtime:>15.3f} {peak_memory / 1e6:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
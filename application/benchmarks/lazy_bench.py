@@ -0,0 +1,43 @@
+from bench_utils import *
+from classes.Dataset import *
+from utils.config_utils import *
+from utils.instance_utils import *
+from utils.graph_utils import *
+from utils.solve_utils import *
+import os
+
+
+def get_partition_instances(config):
+    """
+    Return instances of dataset partitions, synthetic ones if dataset is not downloaded
+    """
+    if os.path.exists(f"datasets/yahoo_finance/{config['dataset_name']}/tickers.xlsx"):
+        instances = get_instances(Dataset(config).prices_dict, config['dtype'])
+        return {name: instance for partitions in instances.values() for name, instance in partitions.items()}
+
+    print("Dataset not found, using synthetic partitions")
+    return {f"synthetic {seed}": get_synthetic_instance(100, seed=seed) for seed in range(3)}
+
+
+def main():
+    config = get_config(3)
+    config.update({'time_limit': 600})
+    threshold, delta = config['thresholds'][0], config['deltas'][0]
+
+    print(f"{'Partition':>14} {'Mode':>10} {'Constrs':>8} {'Build (s)':>10} {'Solve (s)':>10} {'ObjVal':>10} {'Status':>8}")
+    for partition_name, instance in get_partition_instances(config).items():
+        _, G2 = get_correlation_power_graph(instance, threshold)
+
+        for c1_mode in ['eager', 'lazy', 'lazy_node']:
+            _, solution = time_solve(G2, instance, config, delta, c1_mode=c1_mode)
+            build_telemetry, solve_telemetry = solution['telemetry']['builds'][0], solution['telemetry']['solves'][0]
+            obj_val = f"{solution['obj_val']:.6f}" if 'obj_val' in solution else "-"
+
+            print(
+                f"{partition_name:>14} {c1_mode:>10} {build_telemetry['num_constrs']:>8} {build_telemetry['build_time']:>10.3f} "
+                f"{solve_telemetry['runtime']:>10.3f} {obj_val:>10} {solution['status']:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,56 @@
+from bench_utils import *
+from utils.graph_utils import *
+import gurobipy as gp
+from gurobipy import GRB
+import math
+
+
+def mip_max_num_of_assets(G2, gamma):
+    """
+    Previous path: maximum independent set MIP in edge formulation, None if model exceeds license limits
+    """
+    V = G2.nodes
+    model = gp.Model("Max_#Assets")
+    model.setParam("OutputFlag", 0)
+    y = model.addVars(V, vtype=GRB.BINARY, name="y")
+    obj_fn = gp.quicksum(y[i] for i in V)
+    model.setObjective(obj_fn, GRB.MAXIMIZE)
+    model.addConstrs((y[i] + y[j] <= 1 for (i, j) in G2.edges), name="c1")
+    model.addConstr(obj_fn <= 1 / gamma, name="c2")
+
+    try:
+        model.optimize()
+    except gp.GurobiError:
+        return None
+
+    return int(round(model.ObjVal))
+
+
+def combinatorial_max_num_of_assets(G2, gamma):
+    """
+    Current path: bounds and branch-and-bound, cache cleared to time a cold call
+    """
+    G2.graph.pop('max_independent_set_size', None)
+
+    return get_max_independent_set_size(G2, math.floor(1 / gamma))
+
+
+def main():
+    gamma = 0.05
+
+    print(f"{'Assets':>8} {'Threshold':>10} {'Edges':>8} {'#Assets':>8} {'MIP (s)':>9} {'Combinatorial (s)':>18}")
+    for n in [100, 500]:
+        instance = get_synthetic_instance(n)
+        graphs = get_correlation_power_graphs(instance, [0.3, 0.5, 0.7, 0.9])
+
+        for t, (_, G2) in sorted(graphs.items()):
+            mip_runtime, mip_num = time_function(mip_max_num_of_assets, G2, gamma)
+            runtime, num = time_function(combinatorial_max_num_of_assets, G2, gamma, repeat=3)
+            mip_runtime = f"{mip_runtime:.4f}" if mip_num is not None else "-"
+            assert mip_num is None or mip_num == num
+
+            print(f"{n:>8} {t:>10} {G2.number_of_edges():>8} {num:>8} {mip_runtime:>9} {runtime:>18.4f}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,73 @@
+from bench_utils import *
+from utils.config_utils import *
+from utils.graph_utils import *
+from utils.solve_utils import *
+from utils.gurobi_utils import build_model
+import gurobipy as gp
+from gurobipy import GRB
+
+
+def quicksum_build(G, instance, config, delta):
+    """
+    Previous path: constraints built term by term with quicksum
+    """
+    V = G.nodes
+    T_range = range(instance.total_days)
+    daily_returns, min_daily_return = instance.daily_returns, instance.min_daily_return
+    R_var = config['R_var']
+
+    model = gp.Model("Max_Return")
+    model.setParam('OutputFlag', 0)
+    x = model.addVars(V, vtype=GRB.CONTINUOUS, name="x")
+    y = model.addVars(V, vtype=GRB.BINARY, name="y")
+    z = model.addVars(T_range, vtype=GRB.BINARY, name="z")
+    model.setObjective(gp.quicksum(instance.mean_return[i] * x[i] for i in V), GRB.MAXIMIZE)
+    model.addConstrs(
+        (gp.quicksum(daily_returns[t, i] * x[i] for i in V) >= R_var - (R_var - min_daily_return[t]) * z[t]
+        for t in T_range),
+        name="c1"
+    )
+    model.addConstr(gp.quicksum(z[t] for t in T_range) / instance.total_days <= delta, name="c2")
+    model.addConstr(gp.quicksum(x[i] for i in V) == 1, name="c3")
+    model.addConstrs((y[i] + gp.quicksum(y[j] for j in G.neighbors(i)) <= 1 for i in V))
+    model.addConstrs((config['gamma'] * y[i] <= x[i] for i in V), name="c5")
+    model.addConstrs((x[i] <= y[i] for i in V), name="c6")
+    model.update()
+
+    return model
+
+
+def matrix_build(G, instance, config, delta):
+    """
+    Current path: constraints built as sparse matrix blocks
+    """
+    form = get_model_form(G, [], instance, config, delta)
+
+    return build_model(form, config, {'save_log': False})
+
+
+def main():
+    config = get_config(3)
+    config.update({'R_var': 0.0, 'time_limit': 60, 'backend': 'gurobi'})
+    threshold, delta = 0.4, 0.3
+
+    print(f"{'Assets':>8} {'Days':>6} {'Quicksum build (s)':>19} {'Matrix build (s)':>17} {'Solve (s)':>10}")
+    for n, total_days in [(30, 60), (100, 250), (500, 250), (2000, 250)]:
+        instance = get_synthetic_instance(n, total_days)
+        _, G2 = get_correlation_power_graph(instance, threshold)
+
+        quicksum_runtime, _ = time_function(quicksum_build, G2, instance, config, delta)
+        matrix_runtime, _ = time_function(matrix_build, G2, instance, config, delta)
+
+        # Solve, skipped if model exceeds license limits
+        try:
+            _, solution = time_solve(G2, instance, config, delta)
+            solve_runtime = f"{solution['telemetry']['solves'][0]['runtime']:.3f}"
+        except gp.GurobiError:
+            solve_runtime = "-"
+
+        print(f"{n:>8} {total_days:>6} {quicksum_runtime:>19.3f} {matrix_runtime:>17.3f} {solve_runtime:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+from bench_utils import *
+from classes.Results import *
+from utils.config_utils import *
+from utils.instance_utils import *
+from utils.graph_utils import *
+from utils.solve_utils import *
+import importlib
+import argparse
+import platform
+import tempfile
+import json
+import os
+import sys
+
+
+# Stored timings of every stage and size with calibration time of the machine, compared against on every run
+baseline_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "pipeline_bench.json")
+
+
+def get_instance(prices_dict):
+    """
+    Return instance of single synthetic partition with its statistics computed
+    """
+    instance = next(iter(get_instances(prices_dict)['synthetic'].values()))
+    instance.correlation_matrix, instance.mean_return, instance.min_daily_return
+
+    return instance
+
+
+def get_power_graphs(instance, thresholds):
+    """
+    Return correlation and power graphs of thresholds as on first call in main, without correlation
+    edges kept by the instance from previous calls
+    """
+    instance._correlation_edges = None
+
+    return get_correlation_power_graphs(instance, thresholds)
+
+
+def calibrate(repeat=5):
+    """
+    Return best runtime of a fixed numpy and python workload, stage runtimes are compared in units of
+    it so baselines of other machines scale with their speed
+    """
+    A = np.random.default_rng(0).random((300, 300))
+
+    def workload():
+        B = A @ A
+        sorted(range(200000), key=lambda i: -i)
+        return B
+
+    return time_function(workload, repeat=repeat)[0]
+
+
+def run_pipeline(n, total_days, config, repeat, solve):
+    """
+    Return best runtime over repeats of every pipeline stage for one instance size, timed on the
+    calls of main. Sizes beyond solver limits time the heuristic start of solve_max_return instead
+    """
+    threshold, delta = config['thresholds'][-1], 0.2
+    flags = {'save_log': False, 'save_results': False}
+    runtimes = {}
+
+    prices_dict = get_synthetic_prices_dict(n, total_days)
+    runtimes['instances'], instance = time_function(get_instance, prices_dict, repeat=repeat)
+    runtimes['power_graphs'], graphs = time_function(get_power_graphs, instance, config['thresholds'], repeat=repeat)
+    G, G2 = graphs[threshold]
+    runtimes['cliques'], _ = time_function(get_cliques, G2, {**config, 'dist_constr': 'clique'}, repeat=repeat)
+
+    # Solve with presolve, heuristic start and telemetry of config, or use heuristic solution for results
+    if solve:
+        runtimes['solve'], solution = time_function(solve_max_return, G2, [], instance, config, flags, delta, repeat=repeat)
+    else:
+        runtimes['heuristic'], solution = time_function(get_heuristic_solution, G2, [], instance, config, delta, repeat=repeat)
+        solution = {**solution, 'status': 'Heuristic'}
+
+    results = Results(flags, config)
+    runtimes['set_data'], _ = time_function(
+        results.set_data, solution, "synthetic", threshold, delta, G, instance, 0.0, repeat=repeat
+    )
+
+    return {f"{stage}/{n}x{total_days}": runtime for stage, runtime in runtimes.items()}
+
+
+def compare(runtimes, baseline, scale, tolerance, min_time):
+    """
+    Print runtimes against baseline scaled to this machine and return stages slower than tolerance
+    times their baseline
+    """
+    regressions = []
+    baseline = {key: runtime * scale for key, runtime in baseline.items()}
+
+    print(f"{'Stage':>28} {'Time (s)':>10} {'Baseline (s)':>13} {'Ratio':>7} {'Status':>11}")
+    for key, runtime in runtimes.items():
+        if key not in baseline:
+            print(f"{key:>28} {runtime:>10.4f} {'-':>13} {'-':>7} {'new':>11}")
+            continue
+
+        ratio = runtime / baseline[key] if baseline[key] > 0 else float('inf')
+        regressed = ratio > tolerance and runtime - baseline[key] > min_time
+        if regressed:
+            regressions.append(key)
+        status = "regression" if regressed else "ok"
+        print(f"{key:>28} {runtime:>10.4f} {baseline[key]:>13.4f} {ratio:>7.2f} {status:>11}")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--save-baseline', action='store_true', help="store runtimes as new baseline")
+    parser.add_argument('--repeat', type=int, default=3, help="repeats per stage, best runtime is kept")
+    parser.add_argument('--tolerance', type=float, default=1.5, help="slowdown ratio over baseline reported as regression")
+    parser.add_argument('--min-time', type=float, default=0.005, help="slowdown in seconds ignored as noise")
+    args = parser.parse_args()
+
+    config = get_config(3)
+    config.update({'R_var': -0.02, 'time_limit': 60, 'thresholds': [0.3, 0.5], 'cache_size': 0})
+
+    # Use HiGHS if gurobi is not installed
+    try:
+        importlib.import_module(f"utils.{config['backend']}_utils")
+    except ImportError:
+        config['backend'] = 'highs'
+
+    # Results folder of set_data is created in a temporary folder
+    os.chdir(tempfile.mkdtemp())
+
+    # Solve only sizes within restricted license limits
+    calibration = calibrate()
+    runtimes = {}
+    for n, total_days, solve in [(100, 250, True), (500, 250, False), (1000, 500, False)]:
+        runtimes.update(run_pipeline(n, total_days, config, args.repeat, solve))
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
+        with open(baseline_path, "w") as f:
+            json.dump({'machine': platform.platform(), 'calibration': calibration, 'runtimes': runtimes}, f, indent=4)
+        print(f"Baseline saved to {baseline_path}")
+        return
+
+    baseline = {'machine': platform.platform(), 'calibration': calibration, 'runtimes': {}}
+    if os.path.exists(baseline_path):
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+
+    # Scale baseline by calibration, ratios between stages still differ across machines
+    scale = calibration / baseline['calibration']
+    print(f"Calibration {calibration:.4f}s, baseline {baseline['calibration']:.4f}s on {baseline['machine']}")
+    if baseline['machine'] != platform.platform():
+        print("Baseline was saved on another machine, save a new baseline with --save-baseline for exact comparisons")
+
+    regressions = compare(runtimes, baseline['runtimes'], scale, args.tolerance, args.min_time)
+    if regressions:
+        print(f"{len(regressions)} stages regressed: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,69 @@
+from bench_utils import *
+from utils.graph_utils import *
+
+
+def bfs_power_graph(instance, threshold):
+    """
+    Previous path: networkx graph from asset pairs and breadth-first search power graph,
+    without negative return vertices
+    """
+    correlation_matrix = instance.correlation_matrix
+    n = len(correlation_matrix)
+    G = nx.Graph()
+    G.add_nodes_from(range(n))
+    G.add_edges_from((i, j) for i in range(n) for j in range(i + 1, n) if correlation_matrix[i, j] > threshold)
+
+    # Vertices within distance 2 of each vertex
+    G2 = nx.Graph()
+    G2.add_nodes_from(range(n))
+    for u in range(n):
+        G2.add_edges_from((u, v) for v in nx.single_source_shortest_path_length(G, u, cutoff=2) if u < v)
+    G2.remove_nodes_from([i for i in range(n) if instance.mean_return[i] < 0])
+
+    return G2
+
+
+def independent_power_graphs(instance, thresholds):
+    """
+    Build correlation and power graph from scratch for every threshold
+    """
+    return {t: get_correlation_power_graph(instance, t) for t in thresholds}
+
+
+def power_graph_bench():
+    threshold = 0.4
+
+    print(f"{'Assets':>8} {'Edges G2':>12} {'BFS (s)':>10} {'Sparse (s)':>11} {'Speedup':>8}")
+    for n in [500, 2000, 5000]:
+        instance = get_synthetic_instance(n)
+
+        bfs_runtime, G2_bfs = time_function(bfs_power_graph, instance, threshold)
+        sparse_runtime, (_, G2) = time_function(get_correlation_power_graph, instance, threshold, repeat=3)
+        assert G2_bfs.number_of_edges() == G2.number_of_edges()
+
+        print(f"{n:>8} {G2.number_of_edges():>12} {bfs_runtime:>10.3f} {sparse_runtime:>11.3f} {bfs_runtime / sparse_runtime:>7.1f}x")
+
+
+def threshold_sweep_bench():
+    thresholds = [0.3, 0.4, 0.5, 0.6, 0.7]
+
+    print(f"{'Assets':>8} {'One (s)':>10} {'Independent (s)':>16} {'Sweep (s)':>10}")
+    for n in [500, 2000]:
+        instance = get_synthetic_instance(n)
+
+        single_runtime, _ = time_function(get_correlation_power_graph, instance, thresholds[0], repeat=3)
+        independent_runtime, graphs = time_function(independent_power_graphs, instance, thresholds, repeat=3)
+        sweep_runtime, sweep_graphs = time_function(get_correlation_power_graphs, instance, thresholds, repeat=3)
+        for t in thresholds:
+            assert (graphs[t][1].adjacency != sweep_graphs[t][1].adjacency).nnz == 0
+
+        print(f"{n:>8} {single_runtime:>10.3f} {independent_runtime:>16.3f} {sweep_runtime:>10.3f}")
+
+
+def main():
+    power_graph_bench()
+    threshold_sweep_bench()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+from bench_utils import *
+from utils.instance_utils import *
+from utils.graph_utils import *
+import tracemalloc
+
+
+def get_graphs(n, total_days, thresholds, block_size):
+    """
+    Return power graphs of a synthetic instance with runtime and peak memory of statistics and graphs
+    """
+    prices_dict = get_synthetic_prices_dict(n, total_days)
+    instance = next(iter(get_instances(prices_dict, 'float64', block_size)['synthetic'].values()))
+
+    tracemalloc.start()
+    runtime, graphs = time_function(get_correlation_power_graphs, instance, thresholds)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return runtime, peak_memory, graphs
+
+
+def main():
+    total_days, thresholds = 250, [0.6, 0.7]
+
+    print(f"{'Assets':>8} {'Block size':>11} {'Edges':>9} {'Runtime (s)':>12} {'Peak memory (MB)':>17}")
+    for n, block_sizes in [(2000, [None, 512, 2048]), (5000, [None, 512, 2048]), (20000, [2048])]:
+        for block_size in block_sizes:
+            runtime, peak_memory, graphs = get_graphs(n, total_days, thresholds, block_size)
+            G = graphs[min(thresholds)][0]
+            block_size = block_size or "dense"
+
+            print(f"{n:>8} {block_size:>11} {G.number_of_edges():>9} {runtime:>12.3f} {peak_memory / 1e6:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,46 @@
+from bench_utils import *
+from utils.config_utils import *
+from utils.graph_utils import *
+from utils.solve_utils import *
+from utils.solve_utils import _solve_max_num_of_assets, _solve_ubs
+
+
+def top_k_ubs(instance, config, max_num_of_assets):
+    """
+    Previous path: top k returns of all assets, sorted again for every k
+    """
+    upper_bounds = []
+    for k in range(1, max_num_of_assets+1):
+        top_k_returns = instance.mean_return[np.argsort(instance.mean_return)[-k:]]
+        weights = np.ones(k) * config['gamma']
+        weights[-1] = 1 - config['gamma'] * (k - 1)
+        upper_bounds.append(weights.dot(top_k_returns))
+
+    return upper_bounds
+
+
+def main():
+    config = get_config(1)
+    config.update({'R_var': -0.02})
+    delta = 0.3
+
+    instance = get_synthetic_instance(500)
+
+    print(f"{'Threshold':>10} {'k':>4} {'Top k':>9} {'Cliques':>9} {'LP':>9} {'Cliques (s)':>12} {'LP (s)':>8}")
+    for t in [0.3, 0.5, 0.7]:
+        _, G2 = get_correlation_power_graph(instance, t)
+        max_num_of_assets = _solve_max_num_of_assets(G2, config)
+
+        top_k = top_k_ubs(instance, config, max_num_of_assets)
+        config['lp_bound'] = False
+        cliques_runtime, cliques = time_function(_solve_ubs, G2, [], instance, config, delta, max_num_of_assets)
+        config['lp_bound'] = True
+        lp_runtime, lp = time_function(_solve_ubs, G2, [], instance, config, delta, max_num_of_assets)
+
+        # Bounds per k, -inf proves k assets infeasible
+        for k in range(1, max_num_of_assets+1):
+            print(f"{t:>10} {k:>4} {top_k[k-1]:>9.5f} {cliques[k-1]:>9.5f} {lp[k-1]:>9.5f} {cliques_runtime:>12.4f} {lp_runtime:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
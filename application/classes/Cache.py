@@ -0,0 +1,87 @@
+import numpy as np
+import hashlib
+import pickle
+import tempfile
+import os
+
+
+class Cache:
+    """
+    Class for content-addressed on-disk cache of pickled artifacts, least recently used
+    files are evicted when their total size exceeds max_size bytes
+    """
+    def __init__(self, path, max_size):
+        self.path = path
+        self.max_size = max_size
+        os.makedirs(self.path, exist_ok=True)
+
+
+    @staticmethod
+    def get_key(*parts):
+        """
+        Return sha256 hash of parts, arrays by their dtype, shape and bytes and other parts by their repr
+        """
+        key = hashlib.sha256()
+        for part in parts:
+            if isinstance(part, np.ndarray):
+                key.update(f"{part.dtype.str}{part.shape}".encode())
+                key.update(np.ascontiguousarray(part).tobytes())
+            else:
+                key.update(repr(part).encode())
+            key.update(b"\0")
+
+        return key.hexdigest()
+
+
+    def get(self, key):
+        """
+        Return cached value of key marked as recently used, None if it is not cached
+        """
+        file_path = self._get_file_path(key)
+        try:
+            with open(file_path, "rb") as f:
+                value = pickle.load(f)
+            os.utime(file_path)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+
+        return value
+
+
+    def set(self, key, value):
+        """
+        Cache value of key and evict least recently used files beyond max size
+        """
+        # Write to temporary file and rename, so other processes never read partial files
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self._get_file_path(key))
+
+        self._evict()
+
+
+    def _evict(self):
+        """
+        Remove files from least to most recently used until total size is at most max size
+        """
+        files = []
+        for entry in os.scandir(self.path):
+            if entry.name.endswith(".pkl"):
+                stat = entry.stat()
+                files.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        total_size = sum(size for _, size, _ in files)
+
+        for _, size, file_path in sorted(files):
+            if total_size <= self.max_size:
+                break
+            # File may be evicted by another process
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+
+    def _get_file_path(self, key):
+        return os.path.join(self.path, key + ".pkl")
\ No newline at end of file
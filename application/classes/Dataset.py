@@ -1,5 +1,8 @@
 import yfinance as yf
 import pandas as pd
+import numpy as np
+import hashlib
+import json
 import os
 
 
@@ -15,7 +18,12 @@ class Dataset:
             "l": "datasets/yahoo_finance/l"
         }
         self.datasets_path = datasets_paths[self.config['dataset_name']]
-        os.makedirs(self.datasets_path, exist_ok=True)
+        self.cache_path = self.datasets_path + "/cache"
+        os.makedirs(self.cache_path, exist_ok=True)
+
+        # Memory-mapped price matrices loaded in this run and dates of partition prices
+        self.price_matrices = {}
+        self.dates = {}
 
         # Get daily prices from chosen dataset
         self.prices_dict = self._get_prices_dict()
@@ -23,7 +31,7 @@ class Dataset:
 
     def _get_prices_dict(self):
         # Set date range
-        date_range = ["2024-01-01", "2025-01-01"]
+        date_range = self.config['date_range']
 
         # Get assets
         assets_dict = self._get_assets_dict()
@@ -55,6 +63,14 @@ class Dataset:
         data = {}
         number_of_assets = self.config['assets']['range']
 
+        # Download prices once if dataset is missing or does not cover date range
+        asset_path = self.datasets_path + "/" + asset_type + ".csv"
+        if not os.path.exists(asset_path) or not self._covers_date_range(asset_type, asset_path, date_range):
+            print(f"Downloading {asset_type} prices of {date_range[0]} - {date_range[1]}")
+            price_data = yf.download(assets, start=date_range[0], end=date_range[1])["Close"]
+            price_data.to_csv(asset_path)
+            self.price_matrices.pop(asset_type, None)
+
         for k in range(self.config['assets']['#partitions']):
             # Set collumns range and partion name
             cols_start = k * number_of_assets
@@ -62,26 +78,108 @@ class Dataset:
             cols_range = range(cols_start, cols_end)
             partition_name = f"{cols_start} - {cols_end-1}"
 
-            # Get data for each partition
-            data[partition_name] = self._get_data_yfinance(asset_type, assets, date_range, cols_range)
+            # Get data and dates for each partition
+            partition_assets, price_data, dates = self._get_data_yfinance(asset_type, date_range, cols_range)
+            data[partition_name] = [partition_assets, price_data]
+            self.dates.setdefault(asset_type, {})[partition_name] = dates
 
         return data
     
 
-    def _get_data_yfinance(self, asset_type, assets, date_range, cols_range):
+    def _get_data_yfinance(self, asset_type, date_range, cols_range):
         """
-        Return price data Loaded from dataset or downloaded and saved
+        Return assets, price data and dates of partition columns loaded from dataset
         """
         asset_path = self.datasets_path + "/" + asset_type + ".csv"
 
-        if os.path.exists(asset_path):
+        # Rows of dates in range, dates are sorted
+        price_matrix, columns, dates = self._get_price_matrix(asset_type, asset_path)
+        rows = slice(np.searchsorted(dates, date_range[0]), np.searchsorted(dates, date_range[1]))
+        price_data = price_matrix[rows, cols_range.start:cols_range.stop]
+        dates = dates[rows]
+        assets = [columns[i] for i, price in zip(cols_range, price_data[0]) if not np.isnan(price)]
+
+        # Drop days with missing prices, keeping the zero-copy slice if there are none
+        valid_days = ~np.isnan(price_data).any(axis=1)
+
+        if valid_days.all():
+            return [assets, price_data, dates.tolist()]
+
+        return [assets, price_data[valid_days], dates[valid_days].tolist()]
+    
+
+    def _get_price_matrix(self, asset_type, asset_path):
+        """
+        Return memory-mapped price matrix, columns and dates, converting csv file to npy once
+        """
+        if asset_type in self.price_matrices:
+            return self.price_matrices[asset_type]
+
+        matrix_path = self.cache_path + "/" + asset_type + ".npy"
+        meta_path = self.cache_path + "/" + asset_type + ".json"
+
+        # Load cache metadata
+        meta = {}
+        if os.path.exists(meta_path) and os.path.exists(matrix_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+
+        # Convert csv file if cache is missing or stale
+        if not self._is_cache_valid(meta, asset_path, meta_path):
             price_data = pd.read_csv(asset_path, index_col=0, parse_dates=True)
-            price_data = price_data.iloc[:, cols_range]
-            assets = price_data.iloc[0].dropna().index.tolist()
-        else:
-            price_data = yf.download(assets, start=date_range[0], end=date_range[1])["Close"]
-            price_data.to_csv(asset_path)
-            
-        price_data = price_data.dropna()
+            np.save(matrix_path, np.asfortranarray(price_data.to_numpy(dtype=np.float64)))
+            meta = {
+                'columns': price_data.columns.tolist(),
+                'dates': price_data.index.strftime('%Y-%m-%d').tolist(),
+                'mtime': os.path.getmtime(asset_path),
+                'hash': self._get_file_hash(asset_path)
+            }
+            with open(meta_path, "w") as f:
+                json.dump(meta, f)
+
+        # Columns are contiguous on disk, so partitions are zero-copy column slices
+        self.price_matrices[asset_type] = (np.load(matrix_path, mmap_mode='r'), meta['columns'], np.array(meta['dates']))
+
+        return self.price_matrices[asset_type]
+
+
+    def _covers_date_range(self, asset_type, asset_path, date_range):
+        """
+        Check dataset dates cover date range, up to a week without trading days at its ends
+        """
+        dates = self._get_price_matrix(asset_type, asset_path)[2].astype('datetime64[D]')
+        start, end = np.datetime64(date_range[0]), min(np.datetime64(date_range[1]), np.datetime64('today'))
+        slack = np.timedelta64(7, 'D')
+
+        return len(dates) > 0 and dates[0] <= start + slack and dates[-1] >= end - slack
+
+
+    def _is_cache_valid(self, meta, asset_path, meta_path):
+        """
+        Check cache against source file modification time, then against its hash
+        """
+        if not meta:
+            return False
+        if meta['mtime'] == os.path.getmtime(asset_path):
+            return True
+        if meta['hash'] != self._get_file_hash(asset_path):
+            return False
+
+        # Same content with a new modification time
+        meta['mtime'] = os.path.getmtime(asset_path)
+        with open(meta_path, "w") as f:
+            json.dump(meta, f)
+
+        return True
+
+
+    def _get_file_hash(self, path):
+        """
+        Return sha256 hash of file content
+        """
+        file_hash = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                file_hash.update(chunk)
 
-        return [assets, price_data.to_numpy()]
\ No newline at end of file
+        return file_hash.hexdigest()
\ No newline at end of file
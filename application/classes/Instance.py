@@ -0,0 +1,170 @@
+import numpy as np
+import copy
+
+
+class Instance:
+    """
+    Class for portfolio instance of a partition, statistics are computed on first access
+    """
+    __slots__ = (
+        'assets', 'daily_returns', 'total_days', 'block_size',
+        '_min_daily_return', '_mean_return', '_sigma', '_correlation_matrix', '_correlation_edges'
+    )
+
+    def __init__(self, assets, prices, dtype='float64', block_size=None):
+        prices = np.asarray(prices, dtype=dtype)
+
+        self.assets = assets
+        self.daily_returns = np.diff(prices, axis=0) / prices[:-1]
+        self.total_days = len(self.daily_returns)
+
+        # Assets per block of correlation edges, None to use the dense correlation matrix
+        self.block_size = block_size
+
+        # Lazily computed statistics
+        self._min_daily_return = None
+        self._mean_return = None
+        self._sigma = None
+        self._correlation_matrix = None
+        self._correlation_edges = None
+
+
+    @property
+    def min_daily_return(self):
+        """
+        Minimum return among assets for each day
+        """
+        if self._min_daily_return is None:
+            self._min_daily_return = np.min(self.daily_returns, axis=1)
+
+        return self._min_daily_return
+
+
+    @property
+    def mean_return(self):
+        """
+        Mean daily return of each asset
+        """
+        if self._mean_return is None:
+            self._mean_return = np.mean(self.daily_returns, axis=0)
+
+        return self._mean_return
+
+
+    @property
+    def sigma(self):
+        """
+        Covariance matrix of daily returns
+        """
+        if self._sigma is None:
+            self._set_covariance_statistics()
+
+        return self._sigma
+
+
+    @property
+    def correlation_matrix(self):
+        """
+        Correlation matrix of daily returns
+        """
+        if self._correlation_matrix is None:
+            self._set_covariance_statistics()
+
+        return self._correlation_matrix
+
+
+    def get_correlation_edges(self, threshold):
+        """
+        Return upper triangle asset pairs with correlation above threshold and their correlations,
+        edges of the lowest threshold so far are kept and filtered for higher ones
+        """
+        if self._correlation_edges is not None and self._correlation_edges[0] <= threshold:
+            _, rows, cols, values = self._correlation_edges
+            mask = values > threshold
+            return rows[mask], cols[mask], values[mask]
+
+        if self.block_size is None:
+            rows, cols = np.nonzero(np.triu(self.correlation_matrix > threshold, k=1))
+            values = self.correlation_matrix[rows, cols]
+        else:
+            rows, cols, values = self._get_blocked_correlation_edges(threshold)
+        self._correlation_edges = (threshold, rows, cols, values)
+
+        return rows, cols, values
+
+
+    def _get_blocked_correlation_edges(self, threshold):
+        """
+        Compute correlation edges from products of standardized daily returns of two asset blocks,
+        holding one block_size x block_size correlation block at a time
+        """
+        n = self.daily_returns.shape[1]
+        block_size = self.block_size
+
+        # Standardized daily returns, constant assets have no edges
+        centered_returns = self.daily_returns - self.mean_return
+        std = np.sqrt(np.einsum('ij,ij->j', centered_returns, centered_returns) / (self.total_days - 1))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            standardized_returns = centered_returns / std
+        del centered_returns
+
+        rows, cols, values = [np.zeros(0, dtype=np.intp)], [np.zeros(0, dtype=np.intp)], [np.zeros(0, dtype=self.daily_returns.dtype)]
+        for i in range(0, n, block_size):
+            Z_i = standardized_returns[:, i:i+block_size]
+            for j in range(i, n, block_size):
+                # Correlation block, upper triangle only on diagonal blocks
+                C = Z_i.T @ standardized_returns[:, j:j+block_size] / (self.total_days - 1)
+                with np.errstate(invalid='ignore'):
+                    mask = C > threshold
+                if i == j:
+                    mask = np.triu(mask, k=1)
+
+                block_rows, block_cols = np.nonzero(mask)
+                rows.append(block_rows + i)
+                cols.append(block_cols + j)
+                values.append(np.clip(C[block_rows, block_cols], -1, 1))
+
+        return np.concatenate(rows), np.concatenate(cols), np.concatenate(values)
+
+
+    def get_solve_copy(self):
+        """
+        Return copy with daily returns, mean and minimum returns used by solving, without covariance,
+        correlation and correlation edges (e.g., to send to solver processes)
+        """
+        # Compute statistics before copying, so copies do not compute them again
+        self.mean_return, self.min_daily_return
+        instance = copy.copy(self)
+        instance._sigma, instance._correlation_matrix, instance._correlation_edges = None, None, None
+
+        return instance
+
+
+    def set_statistics(self, mean_return, sigma):
+        """
+        Set mean return and covariance computed elsewhere (e.g., rolling window updates)
+        """
+        self._mean_return = np.asarray(mean_return, dtype=self.daily_returns.dtype)
+        self._sigma = np.asarray(sigma, dtype=self.daily_returns.dtype)
+        self._set_correlation_matrix()
+        self._correlation_edges = None
+
+
+    def _set_covariance_statistics(self):
+        """
+        Compute covariance and correlation from a single product of centered daily returns
+        """
+        centered_returns = self.daily_returns - self.mean_return
+        self._sigma = centered_returns.T @ centered_returns / (self.total_days - 1)
+        self._set_correlation_matrix()
+
+
+    def _set_correlation_matrix(self):
+        """
+        Scale covariance by standard deviations
+        """
+        std = np.sqrt(np.diag(self._sigma))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self._correlation_matrix = self._sigma / std[:, None]
+            self._correlation_matrix /= std[None, :]
+        np.clip(self._correlation_matrix, -1, 1, out=self._correlation_matrix)
\ No newline at end of file
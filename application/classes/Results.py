@@ -1,8 +1,8 @@
 from utils.calculation_utils import *
 import matplotlib.pyplot as plt
-import networkx as nx
 import pandas as pd
 import numpy as np
+import json
 import sys
 import os
 
@@ -18,11 +18,15 @@ class Results:
         self.data = []
         self.iters_data = []
         self.ref_data = []
+        self.backtest_data = []
+        self.frontier_data = []
 
         self.solution_columns = [
-            "Partition", "Threshold", "Delta", "Density", "Portfolio",
+            "Partition", "Threshold", "Delta", "Density", "Eliminated Binaries", "Eliminated Days", "Portfolio",
             "Expected Return", "Expected Return (Bound)", "Portfolio Variance",
-            "Average Correlation", "Runtime (s)", "Status"
+            "Average Correlation", "CVaR 95%", "Bad Days (%)", "Max Drawdown",
+            "Presolve (s)", "Build (s)", "Root (s)", "Solve (s)", "#Variables", "#Constraints", "#Solves",
+            "Runtime (s)", "Status"
         ]
         self.iters_columns = [
             "Partition", "Best ObjVal", "Ref ObjVal", "Dif ObjVal (%)", "ObjVals",
@@ -30,6 +34,14 @@ class Results:
             "ObjBounds (unsolved)", "Gaps (%) (unsolved)", "Runtimes (s)",
             "Total Runtime (s)", "Ref Total Runtime (s)", "Ref Status"
         ]
+        self.backtest_columns = [
+            "Asset Type", "Partition", "Threshold", "Delta", "Date", "Portfolio", "Expected Return",
+            "Out-of-Sample Return", "Cumulative Return", "Runtime (s)", "Status"
+        ]
+        self.frontier_columns = [
+            "Partition", "Threshold", "Delta", "R_var", "Portfolio", "Expected Return", "Portfolio Variance",
+            "Bad Days (%)", "#Solves", "Solve (s)", "Status"
+        ]
         self.row_length = [
             len(self.solution_columns),
             len(self.iters_columns)
@@ -39,6 +51,10 @@ class Results:
         self.path = "application/results/"
         os.makedirs(self.path, exist_ok=True)
 
+        # Journal of finished jobs for resuming and their telemetry
+        self.journal_path = self.path + f"journal{self.config['idx']}.jsonl"
+        self.telemetry_path = self.path + f"telemetry{self.config['idx']}.jsonl"
+
         # Get reference data
         self.get_ref_data()
 
@@ -74,28 +90,86 @@ class Results:
             self.ref_data.append([{portfolios[i][1]: round(objvals[i], 4)}, runtimes[i], status[i]])
 
 
+    def start_journal(self, resume):
+        """
+        Return finished jobs from journal when resuming, otherwise start an empty journal
+        """
+        job_results = {}
+
+        if not resume or not os.path.exists(self.journal_path):
+            open(self.journal_path, "w").close()
+            open(self.telemetry_path, "w").close()
+            return job_results
+
+        valid_lines = []
+        with open(self.journal_path) as f:
+            for line in f:
+                # Skip line partially written before a crash
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                valid_lines.append(line.rstrip("\n") + "\n")
+
+                solution = entry['solution']
+                if 'x' in solution:
+                    solution['x'] = {int(i): value for i, value in solution['x'].items()}
+                job_results[tuple(entry['key'])] = (solution, entry['runtime'])
+
+        # Rewrite journal without partial lines before appending
+        with open(self.journal_path, "w") as f:
+            f.writelines(valid_lines)
+
+        return job_results
+
+
+    def append_journal(self, key, solution, runtime):
+        """
+        Append finished job to journal
+        """
+        entry = {'key': list(key), 'solution': solution, 'runtime': runtime}
+
+        with open(self.journal_path, "a") as f:
+            f.write(json.dumps(entry, default=float) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+    def append_telemetry(self, key, solution, runtime):
+        """
+        Append telemetry of finished job
+        """
+        if 'telemetry' not in solution:
+            return
+
+        entry = {'key': list(key), 'runtime': runtime, 'status': solution['status'], **solution['telemetry']}
+
+        with open(self.telemetry_path, "a") as f:
+            f.write(json.dumps(entry, default=float) + "\n")
+
+
     def set_data(self, solution, partition_name, t, delta, G, instance, runtime):
         """
         Set data results
         """
-        (assets, daily_returns, min_daily_return, mean_return,
-         correlation_matrix, sigma, asset_pairs, total_days) = instance
-
         keys = ['x', 'selected_idx', 'obj_val', 'obj_bound', 'status']
         keys_iter = ['obj_vals', 'obj_bounds', 'solved_iters', 'iter_runtimes', 'best_idx']
         x, selected_idx, obj_val, obj_bound, status = (solution.get(k, "-") for k in keys)
+        eliminated_binaries = solution.get('presolve', {}).get('eliminated_binaries', "-")
+        eliminated_days = sum(solution['day_reduction'].values()) if 'day_reduction' in solution else "-"
         obj_vals, obj_bounds, solved_iters, iter_runtimes, best_idx = (solution.get('iter_results', {}).get(k, "-") for k in keys_iter)
 
-        # Calculate data resutls
-        portfolio = [assets[i] for i in selected_idx]
-        variance = sum(x[i] * sigma[i, j] * x[j] for i in G.nodes for j in G.nodes)
-        pairs = {(i, j) for idx, i in enumerate(selected_idx) for j in selected_idx[idx + 1:]}
-        avg_corr = np.mean([abs(correlation_matrix[i, j]) for i, j in pairs]) if pairs else 0
+        # Calculate data resutls from selected assets only
+        portfolio = [instance.assets[i] for i in selected_idx] if x != "-" else []
+        metrics = get_portfolio_metrics(instance.daily_returns, x, selected_idx, self.config['R_var']) if portfolio else {}
+        metrics_keys = ['variance', 'avg_corr', 'cvar', 'bad_days', 'max_drawdown']
+        telemetry = get_telemetry_metrics(solution['telemetry']) if 'telemetry' in solution else {}
+        telemetry_keys = ['presolve_time', 'build_time', 'root_time', 'solve_time', 'num_vars', 'num_constrs', 'num_solves']
 
         # Append solution result data
         self.data.append([
-            partition_name, t, delta, nx.density(G), {len(portfolio): portfolio},
-            obj_val, obj_bound, variance, avg_corr, runtime, status
+            partition_name, t, delta, G.density(), eliminated_binaries, eliminated_days, {len(portfolio): portfolio}, obj_val, obj_bound,
+            *(metrics.get(k, "-") for k in metrics_keys), *(telemetry.get(k, "-") for k in telemetry_keys), runtime, status
         ])
 
         # --- Iteration warmstart method ---
@@ -128,6 +202,37 @@ class Results:
                 ref_runtime, ref_status
             ])
 
+
+
+    def set_backtest_data(self, rebalance):
+        """
+        Set data of a backtest rebalance
+        """
+        solution = rebalance['solution']
+        selected_idx = solution.get('selected_idx', [])
+        portfolio = [rebalance['instance'].assets[i] for i in selected_idx]
+
+        self.backtest_data.append([
+            *rebalance['key'], rebalance['date'], {len(portfolio): portfolio}, solution.get('obj_val', "-"),
+            rebalance['period_return'], rebalance['cumulative_return'], rebalance['runtime'], solution['status']
+        ])
+
+
+    def set_frontier_data(self, solution, partition_name, t, delta, R_var, instance):
+        """
+        Set data of a frontier point, points taken from the loosest delta have no solves
+        """
+        selected_idx = solution.get('selected_idx', [])
+        portfolio = [instance.assets[i] for i in selected_idx]
+        metrics = get_portfolio_metrics(instance.daily_returns, solution['x'], selected_idx, R_var) if portfolio else {}
+        telemetry = get_telemetry_metrics(solution['telemetry']) if 'telemetry' in solution else {}
+
+        self.frontier_data.append([
+            partition_name, t, delta, R_var, {len(portfolio): portfolio}, solution.get('obj_val', "-"),
+            metrics.get('variance', "-"), metrics.get('bad_days', "-"), telemetry.get('num_solves', "-"),
+            telemetry.get('solve_time', "-"), solution['status']
+        ])
+
             
     def fill_row(self, _list, row_idx):
         return (_list + [""] * self.row_length[row_idx])[:self.row_length[row_idx]]
@@ -178,9 +283,9 @@ class Results:
         if not self.flags['plot_results']:
             return
             
-        results = np.array(results.data)
-        expected_return = results[:, 1]
-        variance = results[:, 2]
+        results = np.array(self.data, dtype=object)
+        expected_return = results[:, self.solution_columns.index("Expected Return")]
+        variance = results[:, self.solution_columns.index("Portfolio Variance")]
 
         def split_on_empty(data):
             groups = []
@@ -190,7 +295,8 @@ class Results:
                     if current:
                         groups.append(current)
                         current = []
-                else:
+                # Skip jobs without portfolio
+                elif val != "-":
                     current.append(val)
             if current:
                 groups.append(current)
@@ -244,4 +350,52 @@ class Results:
         
         # Create dataframe for exporting to xlsx file
         df = pd.DataFrame(self.iters_data, columns=self.iters_columns)
-        df.to_excel(self.path + f"iters_results{self.config['idx']}.xlsx", index=False)
\ No newline at end of file
+        df.to_excel(self.path + f"iters_results{self.config['idx']}.xlsx", index=False)
+
+
+    def save_backtest(self):
+        """
+        Save backtest results in results folder
+        """
+        if not self.flags['save_results']:
+            return
+
+        # Create dataframe for exporting to xlsx file
+        df = pd.DataFrame(self.backtest_data, columns=self.backtest_columns)
+        df.to_excel(self.path + f"backtest{self.config['idx']}.xlsx", index=False)
+
+
+    def plot_frontier(self):
+        """
+        Plot expected return vs variance of frontier points, one curve per R_var
+        """
+        if not self.flags['plot_results']:
+            return
+
+        df = pd.DataFrame(self.frontier_data, columns=self.frontier_columns)
+        df = df[df["Portfolio Variance"] != "-"]
+
+        # Plot each partition and threshold separately
+        for (partition_name, t), group in df.groupby(["Partition", "Threshold"], sort=False):
+            plt.figure()
+            for R_var, points in group.groupby("R_var", sort=False):
+                plt.plot(points["Portfolio Variance"].astype(float), points["Expected Return"].astype(float), marker='o', label=f"R_var = {R_var}")
+            plt.xlabel("Variance")
+            plt.ylabel("Expected Return")
+            plt.title(f"{partition_name}, Threshold {t}: Expected Return vs Variance")
+            plt.legend()
+            plt.grid(True)
+            plt.tight_layout()
+            plt.show()
+
+
+    def save_frontier(self):
+        """
+        Save frontier results in results folder
+        """
+        if not self.flags['save_results']:
+            return
+
+        # Create dataframe for exporting to xlsx file
+        df = pd.DataFrame(self.frontier_data, columns=self.frontier_columns)
+        df.to_excel(self.path + f"frontier{self.config['idx']}.xlsx", index=False)
\ No newline at end of file
@@ -0,0 +1,51 @@
+import numpy as np
+
+
+class RollingStatistics:
+    """
+    Class for mean and covariance of daily returns over a sliding window of days, updated by adding
+    and removing the days that enter and leave the window instead of recomputing them per window
+    """
+    def __init__(self, daily_returns, window):
+        self.daily_returns = daily_returns
+        self.window = window
+        self.start = None
+
+        # Sums of daily returns and of their outer products over window days
+        self._sum = None
+        self._outer_sum = None
+
+
+    def slide(self, start):
+        """
+        Move window to days [start, start + window), recomputing sums only if no day is shared
+        """
+        if self.start is None or abs(start - self.start) >= self.window:
+            days = np.asarray(self.daily_returns[start:start+self.window], dtype=np.float64)
+            self._sum = days.sum(axis=0)
+            self._outer_sum = days.T @ days
+            self.start = start
+            return
+
+        # Rank-k update with added and removed days
+        if start > self.start:
+            added = self.daily_returns[self.start+self.window:start+self.window]
+            removed = self.daily_returns[self.start:start]
+        else:
+            added = self.daily_returns[start:self.start]
+            removed = self.daily_returns[start+self.window:self.start+self.window]
+        added, removed = np.asarray(added, dtype=np.float64), np.asarray(removed, dtype=np.float64)
+
+        self._sum += added.sum(axis=0) - removed.sum(axis=0)
+        self._outer_sum += added.T @ added - removed.T @ removed
+        self.start = start
+
+
+    def get_statistics(self):
+        """
+        Return mean return and covariance matrix of current window
+        """
+        mean_return = self._sum / self.window
+        sigma = (self._outer_sum - self.window * np.outer(mean_return, mean_return)) / (self.window - 1)
+
+        return mean_return, sigma
\ No newline at end of file
@@ -0,0 +1,110 @@
+import scipy.sparse as sp
+import networkx as nx
+import numpy as np
+
+
+class SparseGraph:
+    """
+    Class for undirected graph over asset indices backed by a CSR adjacency matrix
+    """
+    def __init__(self, adjacency):
+        # Symmetric boolean adjacency without self loops
+        self.adjacency = sp.csr_matrix(adjacency, dtype=bool)
+        self.adjacency.setdiag(False)
+        self.adjacency.eliminate_zeros()
+
+        # Set active vertices
+        self.node_mask = np.ones(self.adjacency.shape[0], dtype=bool)
+        self.nodes = list(range(self.adjacency.shape[0]))
+
+        # Graph attributes and networkx graph built on demand
+        self.graph = {}
+        self._nx_graph = None
+
+
+    @property
+    def edges(self):
+        """
+        Return edges (i, j) with i < j
+        """
+        upper = sp.triu(self.adjacency, k=1).tocoo()
+        return list(zip(upper.row.tolist(), upper.col.tolist()))
+
+
+    def neighbors(self, i):
+        """
+        Return neighbors of vertex i
+        """
+        indptr, indices = self.adjacency.indptr, self.adjacency.indices
+        return indices[indptr[i]:indptr[i + 1]].tolist()
+
+
+    def number_of_nodes(self):
+        return len(self.nodes)
+
+
+    def number_of_edges(self):
+        return self.adjacency.nnz // 2
+
+
+    def density(self):
+        """
+        Return graph density, same definition as networkx
+        """
+        n = self.number_of_nodes()
+        if n <= 1:
+            return 0
+
+        return 2 * self.number_of_edges() / (n * (n - 1))
+
+
+    def remove_nodes_from(self, vertices):
+        """
+        Remove vertices and their incident edges
+        """
+        vertices = list(vertices)
+        if not vertices:
+            return
+
+        self.node_mask[vertices] = False
+        self.nodes = np.flatnonzero(self.node_mask).tolist()
+
+        # Drop incident edges by masking rows and columns
+        mask = sp.diags(self.node_mask, dtype=bool)
+        self.adjacency = sp.csr_matrix(mask @ self.adjacency @ mask, dtype=bool)
+        self.adjacency.eliminate_zeros()
+        self._nx_graph = None
+
+
+    def copy(self):
+        """
+        Return copy with same active vertices and empty graph attributes
+        """
+        G = SparseGraph.__new__(SparseGraph)
+        G.adjacency = self.adjacency.copy()
+        G.node_mask = self.node_mask.copy()
+        G.nodes = list(self.nodes)
+        G.graph = {}
+        G._nx_graph = None
+
+        return G
+
+
+    def __getstate__(self):
+        # Networkx graph is rebuilt on demand after unpickling
+        state = self.__dict__.copy()
+        state['_nx_graph'] = None
+
+        return state
+
+
+    def to_networkx(self):
+        """
+        Return networkx graph, built only when needed (e.g. plotting)
+        """
+        if self._nx_graph is None:
+            self._nx_graph = nx.Graph()
+            self._nx_graph.add_nodes_from(self.nodes)
+            self._nx_graph.add_edges_from(self.edges)
+
+        return self._nx_graph
\ No newline at end of file
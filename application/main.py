@@ -5,6 +5,10 @@ from utils.config_utils import *
 from utils.instance_utils import *
 from utils.graph_utils import *
 from utils.solve_utils import *
+from utils.cache_utils import *
+from utils.parallel_utils import *
+from utils.backtest_utils import *
+import argparse
 
 
 # Set parameter flags
@@ -20,39 +24,62 @@ flags = {
 config = get_config(3)
 
 
-def main():
+def main(resume=False):
     # Get dataset
     dt = Dataset(config)
     results = Results(flags, config)
 
     # Get instances
-    instances = get_instances(dt.prices_dict)
+    instances = get_instances(dt.prices_dict, config['dtype'], config['block_size'] if config['streaming'] else None)
+    cache = get_cache(config)
 
     # Create Timer class after loading instances
     timer = Timer()
 
+    # Create or load cached network power graphs and maximal cliques for the clique formulation, one job per delta
+    graphs = {}
+    jobs = []
     for asset_type, partition_instances in instances.items():
-        results.set_data_row([asset_type])
-
         for partition_name, instance in partition_instances.items():
+            partition_graphs = get_cached_correlation_power_graphs(instance, config['thresholds'], cache)
+
             for t in config['thresholds']:
-                # Create network power graph and get maximal cliques
-                G, G2 = get_correlation_power_graph(instance, t)
-                cliques = [tuple(c) for c in nx.find_cliques(G2)]
+                G, G2 = partition_graphs[t]
+                cliques = get_cached_cliques(G2, config, cache)
+                graphs[asset_type, partition_name, t] = G
 
                 for delta in config['deltas']:
-                    # Solve optimal portfolio
-                    timer.reset()
-                    solution = solve_max_return(G2, cliques, instance, config, flags, delta)
-                    timer.mark()
-                    timer.update()
-
-                    # Set results
-                    results.set_data(solution, partition_name, t, delta, G, instance, timer.runtimes[0])
+                    jobs.append({
+                        'key': (asset_type, partition_name, t, delta),
+                        'G2': G2, 'cliques': cliques, 'instance': instance, 'delta': delta
+                    })
 
                 # Show graphs
                 show_graphs([G2], flags['plot'])
 
+    # Get jobs finished in a previous run
+    job_results = results.start_journal(resume)
+    pending_jobs = [job for job in jobs if job['key'] not in job_results]
+
+    # Solve optimal portfolios, saving each one and its telemetry to journal as it finishes
+    for key, solution, runtime in solve_jobs(pending_jobs, config, flags):
+        job_results[key] = (solution, runtime)
+        results.append_journal(key, solution, runtime)
+        results.append_telemetry(key, solution, runtime)
+    timer.update()
+
+    # Set results in deterministic order
+    for asset_type, partition_instances in instances.items():
+        results.set_data_row([asset_type])
+
+        for partition_name, instance in partition_instances.items():
+            for t in config['thresholds']:
+                G = graphs[asset_type, partition_name, t]
+
+                for delta in config['deltas']:
+                    solution, runtime = job_results[asset_type, partition_name, t, delta]
+                    results.set_data(solution, partition_name, t, delta, G, instance, runtime)
+
         results.set_data_row([])
     results.set_data_config()
     
@@ -64,5 +91,63 @@ def main():
     results.save()
 
 
+def backtest():
+    # Get dataset of backtest date range
+    dt = Dataset({**config, 'date_range': config['backtest']['date_range']})
+    results = Results(flags, config)
+
+    # Solve optimal portfolios on rolling windows
+    timer = Timer()
+    for rebalance in run_backtest(dt, config, flags):
+        results.set_backtest_data(rebalance)
+        timer.update()
+        results.print(timer.total_runtime)
+
+    # Save results
+    results.save_backtest()
+
+
+def frontier():
+    # Get dataset
+    dt = Dataset(config)
+    results = Results(flags, config)
+
+    # Get instances
+    instances = get_instances(dt.prices_dict, config['dtype'], config['block_size'] if config['streaming'] else None)
+    cache = get_cache(config)
+
+    # Solve frontier of every partition and threshold, reusing solutions between grid points
+    timer = Timer()
+    for asset_type, partition_instances in instances.items():
+        for partition_name, instance in partition_instances.items():
+            partition_graphs = get_cached_correlation_power_graphs(instance, config['thresholds'], cache)
+
+            for t in config['thresholds']:
+                _, G2 = partition_graphs[t]
+                cliques = get_cached_cliques(G2, config, cache)
+                solutions = solve_frontier(G2, cliques, instance, config, flags, config['frontier']['deltas'], config['frontier']['R_vars'])
+
+                for (delta, R_var), solution in sorted(solutions.items(), key=lambda item: item[0][::-1]):
+                    results.set_frontier_data(solution, partition_name, t, delta, R_var, instance)
+                timer.update()
+                results.print(timer.total_runtime)
+
+    # Plot results
+    results.plot_frontier()
+    # Save results
+    results.save_frontier()
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--resume', action='store_true', help="skip jobs already saved in results journal")
+    parser.add_argument('--backtest', action='store_true', help="solve portfolios on rolling windows of config['backtest']")
+    parser.add_argument('--frontier', action='store_true', help="solve portfolios on delta and R_var grid of config['frontier']")
+    args = parser.parse_args()
+
+    if args.backtest:
+        backtest()
+    elif args.frontier:
+        frontier()
+    else:
+        main(args.resume)
\ No newline at end of file
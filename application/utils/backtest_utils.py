@@ -0,0 +1,60 @@
+from classes.Instance import *
+from classes.RollingStatistics import *
+from classes.Timer import *
+from utils.calculation_utils import *
+from utils.graph_utils import *
+from utils.solve_utils import *
+
+
+def run_backtest(dt, config, flags):
+    """
+    Solve optimal portfolios over rolling windows of every partition, rebalancing every step days,
+    and yield each rebalance with the return of its portfolio over the following days
+    """
+    window, step = config['backtest']['window'], config['backtest']['step']
+    cache = get_cache(config)
+
+    for asset_type, partitions in dt.prices_dict.items():
+        for partition_name, (assets, prices) in partitions.items():
+            dates = dt.dates[asset_type][partition_name]
+            daily_returns = Instance(assets, prices, config['dtype']).daily_returns
+            statistics = RollingStatistics(daily_returns, window)
+
+            # Graph states and previous portfolios are carried between windows
+            graph_states = {t: None for t in config['thresholds']}
+            previous_solutions = {}
+            wealth = {}
+
+            # Every window is followed by at least one out-of-sample day
+            for start in range(0, len(daily_returns) - window, step):
+                # Window instance with rolling statistics
+                instance = Instance(assets, prices[start:start+window+1], config['dtype'])
+                statistics.slide(start)
+                instance.set_statistics(*statistics.get_statistics())
+                out_of_sample_returns = daily_returns[start+window:start+window+step]
+
+                for t in config['thresholds']:
+                    G, G2, graph_states[t] = get_rolling_correlation_power_graph(instance, t, graph_states[t])
+                    cliques = get_cached_cliques(G2, config, cache)
+
+                    for delta in config['deltas']:
+                        # Start from portfolio of previous window
+                        timer = Timer()
+                        timer.reset()
+                        solution = solve_max_return(G2, cliques, instance, config, flags, delta, previous_solutions.get((t, delta), {}))
+                        timer.mark()
+                        timer.update()
+
+                        # Hold portfolio until next rebalance, cash if none is found
+                        if 'x' in solution:
+                            previous_solutions[t, delta] = solution
+                            period_return = get_period_return(out_of_sample_returns, solution['x'], solution['selected_idx'])
+                        else:
+                            period_return = 0.0
+                        wealth[t, delta] = wealth.get((t, delta), 1.0) * (1 + period_return)
+
+                        yield {
+                            'key': (asset_type, partition_name, t, delta), 'date': dates[start+window],
+                            'solution': solution, 'instance': instance, 'G': G, 'runtime': timer.runtimes[0],
+                            'period_return': period_return, 'cumulative_return': wealth[t, delta] - 1
+                        }
\ No newline at end of file
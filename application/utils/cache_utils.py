@@ -0,0 +1,73 @@
+from classes.Cache import *
+from utils.graph_utils import *
+
+
+# Folder of graph, clique and solution cache
+cache_path = "application/cache"
+
+
+def get_cache(config):
+    """
+    Return on-disk cache bounded by config['cache_size'] bytes, None if it is disabled
+    """
+    if not config['cache_size']:
+        return None
+
+    return Cache(cache_path, config['cache_size'])
+
+
+def get_cached_correlation_power_graphs(instance, thresholds, cache=None):
+    """
+    Return correlation graph and power graph for every threshold as get_correlation_power_graphs,
+    graphs of thresholds cached for the same daily returns are loaded instead of computed
+    """
+    if cache is None:
+        return get_correlation_power_graphs(instance, thresholds)
+
+    instance_hash = get_instance_hash(instance)
+    keys = {t: Cache.get_key('power_graphs', instance_hash, t) for t in thresholds}
+    graphs = {t: cache.get(key) for t, key in keys.items()}
+    missing = [t for t, graph in graphs.items() if graph is None]
+
+    # Compute and cache graphs of missing thresholds
+    if missing:
+        graphs.update(get_correlation_power_graphs(instance, missing))
+        for t in missing:
+            cache.set(keys[t], graphs[t])
+
+    return graphs
+
+
+def get_cached_cliques(G, config, cache=None):
+    """
+    Return cliques of G as get_cliques, cliques cached for the same graph and cap are loaded instead of computed
+    """
+    if cache is None or config['dist_constr'] != 'clique':
+        return get_cliques(G, config)
+
+    key = Cache.get_key('cliques', get_graph_hash(G), config['max_cliques'])
+    cliques = cache.get(key)
+    if cliques is None:
+        cliques = get_cliques(G, config)
+        cache.set(key, cliques)
+
+    return cliques
+
+
+def get_solution_key(G, instance, config, delta):
+    """
+    Return cache key of a solution from graph, daily returns and settings that change the solution
+    """
+    settings = [
+        'R_var', 'gamma', 'dist_constr', 'max_cliques', 'valid_day_constr', 'presolve', 'delta_constr',
+        'day_reduction', 'c1_mode', 'iterative_warmstart', 'lp_bound', 'backend'
+    ]
+
+    return Cache.get_key('solution', get_graph_hash(G), get_instance_hash(instance), delta, *(config[k] for k in settings))
+
+
+def get_instance_hash(instance):
+    """
+    Return hash of daily returns of instance, statistics and graphs of instances with the same hash are the same
+    """
+    return Cache.get_key(instance.daily_returns)
\ No newline at end of file
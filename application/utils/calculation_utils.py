@@ -6,4 +6,62 @@ def round_array(_array, round_number):
 
 
 def round_dict(_dict, round_number):
-    return {key: round(value, round_number) if isinstance(value, (int, float)) else value for key, value in _dict.items()}
\ No newline at end of file
+    return {key: round(value, round_number) if isinstance(value, (int, float)) else value for key, value in _dict.items()}
+
+
+def get_portfolio_metrics(daily_returns, x, selected_idx, R_var, cvar_level=0.95, tol=1e-6):
+    """
+    Return risk metrics of a portfolio using only the columns of its selected assets,
+    days at R_var within solver tolerance are not bad days
+    """
+    weights = np.array([x[i] for i in selected_idx])
+    selected_returns = daily_returns[:, selected_idx]
+    portfolio_returns = selected_returns @ weights
+
+    # Variance w' sigma w and average absolute correlation over selected submatrices
+    sigma = np.atleast_2d(np.cov(selected_returns, rowvar=False))
+    std = np.sqrt(np.diag(sigma))
+    correlation_matrix = sigma / np.outer(std, std)
+    rows, cols = np.triu_indices(len(selected_idx), k=1)
+
+    # Expected loss over worst days
+    num_of_tail_days = max(1, int(np.ceil((1 - cvar_level) * len(portfolio_returns))))
+    tail_returns = np.partition(portfolio_returns, num_of_tail_days - 1)[:num_of_tail_days]
+
+    # Largest relative drop of cumulative wealth from its running peak
+    wealth = np.cumprod(1 + portfolio_returns)
+    drawdowns = 1 - wealth / np.maximum.accumulate(wealth)
+
+    return {
+        'variance': float(weights @ sigma @ weights),
+        'avg_corr': float(np.mean(np.abs(correlation_matrix[rows, cols]))) if len(rows) else 0,
+        'cvar': float(-np.mean(tail_returns)),
+        'bad_days': float(np.mean(portfolio_returns < R_var - tol) * 100),
+        'max_drawdown': float(np.max(drawdowns))
+    }
+
+
+def get_period_return(daily_returns, x, selected_idx):
+    """
+    Return compounded return of a portfolio with constant weights over days of daily returns
+    """
+    weights = np.array([x[i] for i in selected_idx])
+
+    return float(np.prod(1 + daily_returns[:, selected_idx] @ weights) - 1)
+
+
+def get_telemetry_metrics(telemetry):
+    """
+    Return phase times and model size of a job from its telemetry, times summed over its models and solves
+    """
+    builds, solves = telemetry['builds'], telemetry['solves']
+
+    return {
+        'presolve_time': telemetry['presolve_time'],
+        'build_time': sum(b['build_time'] for b in builds),
+        'root_time': sum(s['root_time'] for s in solves if s['root_time'] is not None),
+        'solve_time': sum(s['runtime'] for s in solves),
+        'num_vars': builds[0]['num_vars'] if builds else "-",
+        'num_constrs': builds[0]['num_constrs'] if builds else "-",
+        'num_solves': len(solves)
+    }
\ No newline at end of file
@@ -5,6 +5,12 @@ def get_config(idx):
                 'idx': 1,
                 'dataset_name': 'l',           # 'm' or 'l'
                 'assets': {'range': 500, '#partitions': 10},
+                'date_range': ['2024-01-01', '2025-01-01'],
+                'backtest': {'date_range': ['2020-01-01', '2025-01-01'], 'window': 250, 'step': 21},  # dates, days of rolling windows and between rebalances
+                'frontier': {'deltas': [0.55, 0.6, 0.65, 0.7, 0.75], 'R_vars': [0.0, 0.005, 0.01, 0.015, 0.02]},  # delta and R_var grid of frontier mode
+                'dtype': 'float64',             # 'float64' or 'float32'
+                'streaming': False,             # correlation edges in blocks, without dense correlation matrix
+                'block_size': 2048,             # assets per block of streaming correlation edges
                 # 'thresholds': [0.3, 0.4, 0.5, 0.6, 0.7],
                 'thresholds': [0.4],
                 # 'deltas': [0.55, 0.6, 0.65, 0.7, 0.75],
@@ -13,9 +19,21 @@ def get_config(idx):
                 'gamma': 0.05,
                 'time_limit': 7200,
                 'dist_constr': 'star',       # 'clique' or 'star'
+                'max_cliques': 100000,          # maximal cliques enumerated, edge clique cover beyond it
                 'valid_day_constr': False,
+                'presolve': True,               # remove dominated assets before solving
                 'delta_constr': 'inequality',   # 'equality' or 'inequality
-                'iterative_warmstart': True
+                'day_reduction': False,         # fix, merge and order dominated days of chance constraint before solving
+                'c1_mode': 'eager',             # 'eager', 'lazy' or 'lazy_node' (also separates node relaxations)
+                'iterative_warmstart': True,
+                'heuristic_start': True,        # greedy and local search start when there is no warmstart
+                'lp_bound': False,              # add LP relaxation bounds to iterative warmstart
+                'backend': 'gurobi',            # 'gurobi' or 'highs'
+                'telemetry': True,              # record build, presolve and solve statistics with MIP progress
+                'cache_size': 2 ** 30,          # bytes of on-disk graph and solution cache, 0 to disable
+                'workers': 1,                   # parallel solver processes
+                'iter_workers': 1,              # parallel processes for k values of iterative warmstart
+                'threads': 0                    # gurobi threads per process, 0 for default
             }
         
         case 2:
@@ -23,15 +41,33 @@ def get_config(idx):
                 'idx': 2,
                 'dataset_name': 'l',           # 'm' or 'l'
                 'assets': {'range': 500, '#partitions': 10},
+                'date_range': ['2024-01-01', '2025-01-01'],
+                'backtest': {'date_range': ['2020-01-01', '2025-01-01'], 'window': 250, 'step': 21},  # dates, days of rolling windows and between rebalances
+                'frontier': {'deltas': [0.01, 0.03, 0.05, 0.07, 0.09], 'R_vars': [-0.02, -0.015, -0.01, -0.005, 0.0]},  # delta and R_var grid of frontier mode
+                'dtype': 'float64',             # 'float64' or 'float32'
+                'streaming': False,             # correlation edges in blocks, without dense correlation matrix
+                'block_size': 2048,             # assets per block of streaming correlation edges
                 'thresholds': [0.4],
                 'deltas': [0.05],
                 'R_var': -0.01,
                 'gamma': 0.05,
                 'time_limit': 7200,
                 'dist_constr': 'star',       # 'clique' or 'star'
+                'max_cliques': 100000,          # maximal cliques enumerated, edge clique cover beyond it
                 'valid_day_constr': False,
+                'presolve': True,               # remove dominated assets before solving
                 'delta_constr': 'inequality',   # 'equality' or 'inequality
-                'iterative_warmstart': True
+                'day_reduction': False,         # fix, merge and order dominated days of chance constraint before solving
+                'c1_mode': 'eager',             # 'eager', 'lazy' or 'lazy_node' (also separates node relaxations)
+                'iterative_warmstart': True,
+                'heuristic_start': True,        # greedy and local search start when there is no warmstart
+                'lp_bound': False,              # add LP relaxation bounds to iterative warmstart
+                'backend': 'gurobi',            # 'gurobi' or 'highs'
+                'telemetry': True,              # record build, presolve and solve statistics with MIP progress
+                'cache_size': 2 ** 30,          # bytes of on-disk graph and solution cache, 0 to disable
+                'workers': 1,                   # parallel solver processes
+                'iter_workers': 1,              # parallel processes for k values of iterative warmstart
+                'threads': 0                    # gurobi threads per process, 0 for default
             }
         
         case 3:
@@ -39,13 +75,31 @@ def get_config(idx):
                 'idx': 3,
                 'dataset_name': 'l',            # 'm' or 'l'
                 'assets': {'range': 500, '#partitions': 1},
+                'date_range': ['2024-01-01', '2025-01-01'],
+                'backtest': {'date_range': ['2020-01-01', '2025-01-01'], 'window': 250, 'step': 21},  # dates, days of rolling windows and between rebalances
+                'frontier': {'deltas': [0.55, 0.6, 0.65, 0.7, 0.75], 'R_vars': [0.0, 0.005, 0.01, 0.015, 0.02]},  # delta and R_var grid of frontier mode
+                'dtype': 'float64',             # 'float64' or 'float32'
+                'streaming': False,             # correlation edges in blocks, without dense correlation matrix
+                'block_size': 2048,             # assets per block of streaming correlation edges
                 'thresholds': [0.4],
                 'deltas': [0.6],
                 'R_var': 0.01,
                 'gamma': 0.05,
                 'time_limit': 7200,
                 'dist_constr': 'star',          # 'clique' or 'star'
+                'max_cliques': 100000,          # maximal cliques enumerated, edge clique cover beyond it
                 'valid_day_constr': False,
+                'presolve': True,               # remove dominated assets before solving
                 'delta_constr': 'inequality',   # 'equality' or 'inequality
-                'iterative_warmstart': False
+                'day_reduction': False,         # fix, merge and order dominated days of chance constraint before solving
+                'c1_mode': 'eager',             # 'eager', 'lazy' or 'lazy_node' (also separates node relaxations)
+                'iterative_warmstart': False,
+                'heuristic_start': True,        # greedy and local search start when there is no warmstart
+                'lp_bound': False,              # add LP relaxation bounds to iterative warmstart
+                'backend': 'gurobi',            # 'gurobi' or 'highs'
+                'telemetry': True,              # record build, presolve and solve statistics with MIP progress
+                'cache_size': 2 ** 30,          # bytes of on-disk graph and solution cache, 0 to disable
+                'workers': 1,                   # parallel solver processes
+                'iter_workers': 1,              # parallel processes for k values of iterative warmstart
+                'threads': 0                    # gurobi threads per process, 0 for default
             }
\ No newline at end of file
@@ -1,60 +1,105 @@
-import networkx as nx
+from classes.SparseGraph import *
+from itertools import islice
 import matplotlib.pyplot as plt
+import scipy.sparse as sp
+import scipy.sparse.csgraph
+import networkx as nx
+import numpy as np
+import hashlib
 
 
 def get_correlation_power_graph(instance, t):
     """
     Return an undirected power graph representing correlated assets
     """
-    G = get_correlation_graph(instance, t)
-    G2 = power_graph(G, 2)
-    remove_negative_return_vertices(G, instance[3])
-    remove_negative_return_vertices(G2, instance[3])
+    return get_correlation_power_graphs(instance, [t])[t]
 
-    return G, G2
 
-
-def get_correlation_graph(instance, threshold=0.5):
+def get_correlation_power_graphs(instance, thresholds):
     """
-    Returns an undirected graph representing correlated assets
+    Return correlation graph and power graph for every threshold, sweeping thresholds in descending
+    order and updating the squared graph with the new edges only
     """
-    (assets, daily_returns, min_daily_return, mean_return,
-     correlation_matrix, sigma, asset_pairs, total_days) = instance
-    
-    # Create graph
-    G = nx.Graph()
+    mean_return = instance.mean_return
+    n = len(instance.assets)
 
-    # Add vertices
-    G.add_nodes_from(range(len(assets)))
+    # Sort upper triangle correlations above lowest threshold once
+    rows, cols, values = instance.get_correlation_edges(min(thresholds))
+    order = np.argsort(-values, kind='stable')
+    rows, cols, values = rows[order], cols[order], -values[order]
 
-    # Add edges
-    edges_to_add = {
-        (i, j) for i, j in asset_pairs if correlation_matrix[i, j] > threshold
-    }
-    G.add_edges_from(edges_to_add)
+    # Adjacency and vertices reachable by walks of length 2
+    A = sp.csr_matrix((n, n), dtype=bool)
+    A2 = sp.csr_matrix((n, n), dtype=bool)
+
+    graphs = {}
+    edges_start = 0
+    for t in sorted(set(thresholds), reverse=True):
+        # Get edges with correlation in (t, previous threshold]
+        edges_end = np.searchsorted(values, -t, side='left')
+        edges = (rows[edges_start:edges_end], cols[edges_start:edges_end])
+        edges_start = edges_end
 
-    return G
+        # Update squared graph with (A + D)^2 = A^2 + AD + (AD)^T + D^2, as A and D are symmetric
+        D = sp.csr_matrix((np.ones(len(edges[0]), dtype=bool), edges), shape=(n, n))
+        D = D + D.T
+        AD = A @ D
+        A2 = A2 + AD + AD.T + D @ D
+        A = A + D
 
+        # Create graphs
+        G = SparseGraph(A)
+        G2 = SparseGraph(A + A2)
+        remove_negative_return_vertices(G, mean_return)
+        remove_negative_return_vertices(G2, mean_return)
+        graphs[t] = (G, G2)
 
-def power_graph(G, k):
+    return graphs
+
+
+def get_rolling_correlation_power_graph(instance, threshold, previous=None):
     """
-    Return k-th power of a graph
+    Return correlation graph, power graph and their state for the next window, updating adjacency
+    and counts of walks of length 2 of the previous window by the edges that changed
     """
-    edges_to_add = set()
-    vertices = list(G.nodes)
+    n = len(instance.assets)
+
+    # Adjacency with integer entries so removed edges can be subtracted
+    rows, cols, _ = instance.get_correlation_edges(threshold)
+    A = sp.csr_matrix((np.ones(len(rows), dtype=np.int64), (rows, cols)), shape=(n, n))
+    A = A + A.T
+
+    # (A + D)^2 = A^2 + AD + (AD)^T + D^2 for edge changes D, as A and D are symmetric
+    if previous is None:
+        walks = A @ A
+    else:
+        A_previous, walks = previous
+        D = A - A_previous
+        D.eliminate_zeros()
+        AD = A_previous @ D
+        walks = walks + AD + AD.T + D @ D
+    walks.eliminate_zeros()
+
+    # Create graphs
+    G = SparseGraph(A)
+    G2 = SparseGraph(A + walks)
+    remove_negative_return_vertices(G, instance.mean_return)
+    remove_negative_return_vertices(G2, instance.mean_return)
+
+    return G, G2, (A, walks)
 
-    for u in vertices:
-        lengths = nx.single_source_shortest_path_length(G, u, cutoff=k)
-        for v in lengths:
-            if u != v:
-                edge = tuple(sorted([u, v]))
-                edges_to_add.add(edge)
 
-    G_power = nx.Graph()
-    G_power.add_nodes_from(vertices)
-    G_power.add_edges_from(edges_to_add)
+def get_correlation_graph(instance, threshold=0.5):
+    """
+    Returns an undirected graph representing correlated assets
+    """
+    n = len(instance.assets)
 
-    return G_power
+    # Add edges from upper triangle of thresholded correlation matrix
+    rows, cols, _ = instance.get_correlation_edges(threshold)
+    adjacency = sp.csr_matrix((np.ones(len(rows), dtype=bool), (rows, cols)), shape=(n, n))
+
+    return SparseGraph(adjacency + adjacency.T)
 
 
 def remove_negative_return_vertices(G, mean_return):
@@ -65,6 +110,265 @@ def remove_negative_return_vertices(G, mean_return):
     G.remove_nodes_from(vertices_to_remove)
 
 
+def get_max_independent_set_size(G, max_size):
+    """
+    Return size of maximum independent set of G capped at max_size, cached in G.graph per cap.
+    Connected components are solved separately with greedy lower and clique cover upper bounds,
+    branch-and-bound only when they do not meet
+    """
+    cache = G.graph.setdefault('max_independent_set_size', {})
+    if max_size in cache:
+        return cache[max_size]
+
+    # Independent set choices of different components do not interact, stop once max_size is reached
+    size = 0
+    for component in get_connected_components(G):
+        if size >= max_size:
+            break
+        # Isolated vertex
+        if len(component) == 1:
+            size += 1
+            continue
+        neighbors = _get_neighbor_bitsets(G, component)
+        size += _get_component_independent_set_size(neighbors, max_size - size)
+
+    cache[max_size] = min(size, max_size)
+
+    return cache[max_size]
+
+
+def get_connected_components(G):
+    """
+    Return vertices of each connected component of G
+    """
+    V = np.array(G.nodes, dtype=int)
+    num_components, labels = sp.csgraph.connected_components(G.adjacency[V][:, V], directed=False)
+
+    # Group vertices by component label
+    order = np.argsort(labels, kind='stable')
+    splits = np.cumsum(np.bincount(labels, minlength=num_components))[:-1]
+
+    return [component.tolist() for component in np.split(V[order], splits)]
+
+
+def presolve_graph(G, instance):
+    """
+    Return copy of G without dominated vertices and presolve statistics, cached in G.graph.
+    Vertex v is dominated by a neighbor u with mean and daily returns at least those of v and closed
+    neighborhood contained in the one of v, then u can replace v in any portfolio with the same weight
+    for both the star and clique diversification constraints
+    """
+    if 'presolve' in G.graph:
+        return G.graph['presolve']
+
+    V = G.nodes
+    neighbors = _get_neighbor_bitsets(G, V)
+    closed_neighbors = [bits | (1 << p) for p, bits in enumerate(neighbors)]
+
+    # Dominance in returns over both directions of every edge
+    upper = sp.triu(G.adjacency[V][:, V], k=1).tocoo()
+    rows, cols = upper.row, upper.col
+    daily_returns, mean_return = instance.daily_returns[:, V], instance.mean_return[V]
+    edges = np.concatenate([np.stack([rows, cols], axis=1), np.stack([cols, rows], axis=1)])
+    dominance = _get_return_dominance(daily_returns, mean_return, edges[:, 0], edges[:, 1])
+
+    # Dominators of each vertex with neighborhood condition
+    dominators = {}
+    for u, v in edges[dominance].tolist():
+        if closed_neighbors[u] & ~closed_neighbors[v] == 0:
+            dominators.setdefault(v, []).append(u)
+
+    # Remove vertex only if one of its dominators is kept, so ties keep one vertex
+    removed = set()
+    for v in sorted(dominators):
+        if any(u not in removed for u in dominators[v]):
+            removed.add(v)
+
+    G_presolved = G.copy()
+    G_presolved.remove_nodes_from([V[p] for p in removed])
+    stats = {
+        'eliminated_binaries': len(removed),
+        'isolated_vertices': int(np.sum(G_presolved.adjacency[G_presolved.nodes].getnnz(axis=1) == 0))
+    }
+    G.graph['presolve'] = (G_presolved, stats)
+
+    return G.graph['presolve']
+
+
+def _get_return_dominance(daily_returns, mean_return, dominators, dominated, chunk_size=10000):
+    """
+    Return whether each dominator has mean and daily returns at least those of the dominated asset
+    """
+    dominance = mean_return[dominators] >= mean_return[dominated]
+
+    # Compare daily returns in chunks of pairs to bound memory
+    for start in range(0, len(dominators), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        dominance[chunk] &= np.all(daily_returns[:, dominators[chunk]] >= daily_returns[:, dominated[chunk]], axis=0)
+
+    return dominance
+
+
+def _get_component_independent_set_size(neighbors, max_size):
+    """
+    Return size of maximum independent set of a component capped at max_size
+    """
+    candidates = (1 << len(neighbors)) - 1
+
+    # Bounds
+    lower_bound = _get_greedy_independent_set_size(neighbors, candidates)
+    upper_bound = min(_get_clique_cover_size(neighbors, candidates), max_size)
+
+    # Exact branch-and-bound, stopped once max_size is reached
+    best = lower_bound
+    stack = [(candidates, 0)] if lower_bound < upper_bound else []
+    while stack and best < upper_bound:
+        candidates, size = stack.pop()
+        if size + _get_clique_cover_size(neighbors, candidates) <= best:
+            continue
+
+        # Branch on vertex with most neighbors among candidates
+        v = max(_iter_bits(candidates), key=lambda u: (neighbors[u] & candidates).bit_count())
+        if neighbors[v] & candidates == 0:
+            best = max(best, size + candidates.bit_count())
+            continue
+        candidates &= ~(1 << v)
+        stack.append((candidates, size))
+        stack.append((candidates & ~neighbors[v], size + 1))
+
+    return min(best, max_size)
+
+
+def get_cliques(G, config):
+    """
+    Return maximal cliques of G for the clique formulation, an edge clique cover if there are more
+    than config['max_cliques']
+    """
+    if config['dist_constr'] != 'clique':
+        return []
+
+    # Stream maximal cliques until cap is exceeded
+    cliques = list(islice(nx.find_cliques(G.to_networkx()), config['max_cliques'] + 1))
+    if len(cliques) > config['max_cliques']:
+        cliques = get_edge_clique_cover(G)
+
+    return [tuple(c) for c in cliques]
+
+
+def get_edge_clique_cover(G):
+    """
+    Return cliques covering every edge of G, at most one vertex per clique still gives an independent set
+    """
+    V = G.nodes
+    neighbors = _get_neighbor_bitsets(G, V)
+    uncovered = list(neighbors)
+    cliques = []
+
+    for u in range(len(V)):
+        while uncovered[u]:
+            # Grow clique from uncovered edge, first with vertices covering more uncovered edges of u
+            v = (uncovered[u] & -uncovered[u]).bit_length() - 1
+            clique = [u, v]
+            candidates = neighbors[u] & neighbors[v]
+            while candidates:
+                preferred = candidates & uncovered[u]
+                w = ((preferred or candidates) & -(preferred or candidates)).bit_length() - 1
+                clique.append(w)
+                candidates &= neighbors[w]
+
+            # Mark edges of clique as covered
+            clique_bits = sum(1 << p for p in clique)
+            for p in clique:
+                uncovered[p] &= ~clique_bits
+            cliques.append([V[p] for p in clique])
+
+    return cliques
+
+
+def get_graph_hash(G):
+    """
+    Return hash of vertices and edges of G
+    """
+    upper = sp.triu(G.adjacency, k=1).tocsr()
+    upper.sort_indices()
+
+    graph_hash = hashlib.sha256(np.asarray(G.nodes, dtype=np.int64).tobytes())
+    graph_hash.update(upper.indptr.astype(np.int64).tobytes())
+    graph_hash.update(upper.indices.astype(np.int64).tobytes())
+
+    return graph_hash.hexdigest()
+
+
+def get_clique_partition(G, priority):
+    """
+    Return greedy partition of G.nodes into cliques, grown from vertices of highest priority first
+    """
+    V = [G.nodes[p] for p in np.argsort(-priority[G.nodes], kind='stable')]
+    neighbors = _get_neighbor_bitsets(G, V)
+    cliques = _get_clique_cover(neighbors, (1 << len(V)) - 1)
+
+    return [[V[p] for p in _iter_bits(clique)] for clique in cliques]
+
+
+def _get_neighbor_bitsets(G, V):
+    """
+    Return neighbors of each vertex as bitsets over positions of V
+    """
+    A = G.adjacency[V][:, V].tocsr()
+    indptr, indices = A.indptr, A.indices.tolist()
+
+    return [sum(1 << u for u in indices[indptr[v]:indptr[v + 1]]) for v in range(A.shape[0])]
+
+
+def _iter_bits(bits):
+    """
+    Yield positions of set bits
+    """
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+def _get_greedy_independent_set_size(neighbors, candidates):
+    """
+    Return size of independent set built by repeatedly taking a vertex with fewest neighbors
+    """
+    size = 0
+    while candidates:
+        v = min(_iter_bits(candidates), key=lambda u: (neighbors[u] & candidates).bit_count())
+        candidates &= ~(neighbors[v] | (1 << v))
+        size += 1
+
+    return size
+
+
+def _get_clique_cover_size(neighbors, candidates):
+    """
+    Return number of cliques of a greedy clique cover, an upper bound on the independent set size
+    """
+    return len(_get_clique_cover(neighbors, candidates))
+
+
+def _get_clique_cover(neighbors, candidates):
+    """
+    Return greedy clique cover as bitsets, cliques grown from lowest positions first
+    """
+    cliques = []
+    while candidates:
+        # Grow clique from lowest vertex among vertices adjacent to all its members
+        clique = candidates & -candidates
+        clique_candidates = candidates & neighbors[clique.bit_length() - 1]
+        while clique_candidates:
+            low = clique_candidates & -clique_candidates
+            clique_candidates &= neighbors[low.bit_length() - 1]
+            clique |= low
+        candidates &= ~clique
+        cliques.append(clique)
+
+    return cliques
+
+
 def show_graphs(graphs, plot_flag=True):
     """
     Plot graphs with faint edges and no labels.
@@ -78,6 +382,7 @@ def show_graphs(graphs, plot_flag=True):
         axes = [axes]
 
     for i, G in enumerate(graphs):
+        G = G.to_networkx()
         pos = nx.spring_layout(G, k=1)
 
         # Draw graph without any labels
@@ -0,0 +1,210 @@
+from utils.model_utils import *
+import gurobipy as gp
+from gurobipy import GRB
+from datetime import datetime
+import numpy as np
+import os
+
+
+def build_model(form, config, flags):
+    """
+    Build gurobi model from model form, settings that change between iterations are set by solve_model
+    """
+    var_slices = form['vars']
+
+    # Create model
+    model = gp.Model("Max_Return")
+    model.setParam('Threads', config['threads'])
+    _save_log(model, flags['save_log'])
+
+    # Add decision variables in model form order
+    variables = {
+        name: model.addMVar(
+            s.stop - s.start, lb=form['lb'][s], ub=form['ub'][s],
+            vtype=np.where(form['integrality'][s] > 0, GRB.BINARY, GRB.CONTINUOUS), name=name
+        )
+        for name, s in var_slices.items()
+    }
+
+    # Set objective function over all variables
+    model.setMObjective(None, form['obj'], 0.0, sense=GRB.MAXIMIZE)
+
+    # Add constraint blocks over all variables
+    constrs = {
+        name: model.addMConstr(c['A'], None, c['sense'], c['rhs'], name=name)
+        for name, c in form['constrs'].items()
+    }
+
+    # Separate c1 rows of remaining days in callback
+    if form['lazy_c1'] is not None:
+        model.setParam('LazyConstraints', 1)
+    model.update()
+
+    return {'model': model, 'form': form, 'vars': variables, 'constrs': constrs, 'all_vars': model.getVars()}
+
+
+def solve_model(model_data, incumbent=None):
+    """
+    Apply iteration settings of model form and solve, sharing incumbents if given
+    """
+    model, form = model_data['model'], model_data['form']
+
+    # Update time limit, warmstart, objective cutoff, c2 and c8
+    model.setParam('TimeLimit', form['time_limit'])
+    model.setParam(GRB.Param.BestBdStop, min(form['bound_stop'], GRB.INFINITY))
+    for name, s in form['vars'].items():
+        model_data['vars'][name].Start = np.nan_to_num(form['start'][s], nan=GRB.UNDEFINED)
+    for name in ['c2', 'c8', 'cutoff']:
+        if name not in form['constrs']:
+            continue
+        c = form['constrs'][name]
+        for constr, sense, rhs in zip(model_data['constrs'][name].tolist(), c['sense'], c['rhs']):
+            constr.Sense, constr.RHS = str(sense), max(rhs, -GRB.INFINITY)
+
+    # Solve
+    callbacks = []
+    if incumbent is not None:
+        callbacks.append(_get_incumbent_callback(incumbent))
+    if form['lazy_c1'] is not None:
+        model_data['lazy_days'] = set()
+        callbacks.append(_get_lazy_callback(model_data))
+    if 'telemetry' in model_data:
+        solve_telemetry = {'root_time': None, 'presolve_removed_rows': 0, 'presolve_removed_cols': 0, 'trajectory': []}
+        callbacks.append(_get_telemetry_callback(solve_telemetry))
+    model.optimize(_compose_callbacks(callbacks))
+
+    # Keep separated days as model rows for later solves of the same model
+    if model_data.get('lazy_days'):
+        rows = add_lazy_rows(form, sorted(model_data['lazy_days']))
+        model.addMConstr(rows['A'], None, rows['sense'], rows['rhs'], name="c1_lazy")
+
+    solution = _get_solution(model_data)
+
+    # Set telemetry of solve with final incumbent and bound
+    if 'telemetry' in model_data:
+        solve_telemetry['trajectory'].append([model.Runtime, solution.get('obj_val'), solution.get('obj_bound', solution.get('obj_val'))])
+        solution['telemetry'] = {
+            'runtime': model.Runtime, 'node_count': model.NodeCount, 'status': solution['status'], **solve_telemetry
+        }
+
+    return solution
+
+
+def _compose_callbacks(callbacks):
+    """
+    Return callback running all callbacks, None if there are none
+    """
+    if not callbacks:
+        return None
+
+    def callback(model, where):
+        for _callback in callbacks:
+            _callback(model, where)
+
+    return callback
+
+
+def _get_solution(model_data):
+    """
+    Return solution dictionary from solved model
+    """
+    model, form = model_data['model'], model_data['form']
+
+    # Infeasible
+    if model.status in [3, 4, 15]:
+        return get_form_solution(form, 'Inf', model.ObjBound)
+    # Stopped since bound cannot improve incumbent found by another process
+    if model.status == GRB.INTERRUPTED:
+        return get_form_solution(form, 'Inf-Ub', model.ObjBound)
+
+    values = np.array(model.X) if model.SolCount > 0 else None
+    obj_val = model.ObjVal if model.SolCount > 0 else None
+    # Timed out
+    if model.status == 9:
+        return get_form_solution(form, 'TL', model.ObjBound, values, obj_val)
+    # Optimal Solution
+    return get_form_solution(form, 'Optimal', model.ObjBound, values, obj_val)
+
+
+def _get_lazy_callback(model_data):
+    """
+    Return callback adding violated c1 rows as lazy constraints at new incumbents,
+    and at node relaxations in 'lazy_node' mode
+    """
+    form, all_vars, lazy_days = model_data['form'], model_data['all_vars'], model_data['lazy_days']
+    lazy_c1 = form['lazy_c1']
+
+    def callback(model, where):
+        if where == GRB.Callback.MIPSOL:
+            values = np.array(model.cbGetSolution(all_vars))
+        elif where == GRB.Callback.MIPNODE and lazy_c1['node'] and model.cbGet(GRB.Callback.MIPNODE_STATUS) == GRB.OPTIMAL:
+            values = np.array(model.cbGetNodeRel(all_vars))
+        else:
+            return
+
+        for t in get_violated_days(form, values):
+            row = lazy_c1['A'][t]
+            model.cbLazy(gp.LinExpr(row.data.tolist(), [all_vars[j] for j in row.indices]) >= lazy_c1['rhs'][t])
+            lazy_days.add(t)
+
+    return callback
+
+
+def _get_telemetry_callback(solve_telemetry, interval=1.0):
+    """
+    Return callback recording presolve reductions, root relaxation time and incumbent and bound over time,
+    bound changes at most every interval seconds
+    """
+    trajectory = solve_telemetry['trajectory']
+
+    def callback(model, where):
+        if where == GRB.Callback.PRESOLVE:
+            solve_telemetry['presolve_removed_rows'] = model.cbGet(GRB.Callback.PRE_ROWDEL)
+            solve_telemetry['presolve_removed_cols'] = model.cbGet(GRB.Callback.PRE_COLDEL)
+        # First node callback comes after root relaxation is solved
+        elif where == GRB.Callback.MIPNODE and solve_telemetry['root_time'] is None:
+            solve_telemetry['root_time'] = model.cbGet(GRB.Callback.RUNTIME)
+        # Add point when incumbent changes or bound changes after interval, None while undefined
+        elif where == GRB.Callback.MIP:
+            runtime = model.cbGet(GRB.Callback.RUNTIME)
+            point = [model.cbGet(GRB.Callback.MIP_OBJBST), model.cbGet(GRB.Callback.MIP_OBJBND)]
+            point = [value if abs(value) < GRB.INFINITY else None for value in point]
+            if not trajectory or trajectory[-1][1] != point[0] or (trajectory[-1][2] != point[1] and runtime - trajectory[-1][0] >= interval):
+                trajectory.append([runtime, *point])
+
+    return callback
+
+
+def _get_incumbent_callback(incumbent):
+    """
+    Return callback sharing new incumbents and stopping once the bound cannot improve the shared incumbent
+    """
+    def callback(model, where):
+        if where == GRB.Callback.MIPSOL:
+            obj_val = model.cbGet(GRB.Callback.MIPSOL_OBJ)
+            with incumbent.get_lock():
+                incumbent.value = max(incumbent.value, obj_val)
+        elif where == GRB.Callback.MIP:
+            if model.cbGet(GRB.Callback.MIP_OBJBND) < incumbent.value - 1e-6:
+                model.terminate()
+
+    return callback
+
+
+def _save_log(model, save_flag):
+    """
+    Save logfile of gurobi formulation for debbuging
+    """
+    if not save_flag:
+        # Disable all output
+        model.setParam('OutputFlag', 0)
+        return
+
+    folder_path = "application/logfiles"
+    date = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+    # Create logfiles folder
+    os.makedirs(folder_path, exist_ok=True)
+
+    # Save logfile
+    model.setParam("LogFile", folder_path + f"/gurobi_log_{date}_{os.getpid()}.txt")
\ No newline at end of file
@@ -0,0 +1,195 @@
+from utils.model_utils import _get_diversification_matrix
+from scipy.optimize import linprog
+import numpy as np
+import math
+
+
+def get_heuristic_solution(G, cliques, instance, config, delta, fix_assets=None, num_candidates=5, max_day_swaps=3, max_swaps=10, max_lps=60):
+    """
+    Return feasible solution from a greedy independent set by mean return, weights from an LP over
+    its good days and swap local search, empty if none is found. Prefixes of the greedy set grow
+    while the objective improves, at most max_swaps swaps are made and max_lps LPs are solved.
+    Only x and y are set, bad days are left to the solver
+    """
+    V = G.nodes
+    gamma = config['gamma']
+    mean_return = instance.mean_return[V]
+    daily_returns = instance.daily_returns[:, V]
+    max_bad_days = math.floor(delta * instance.total_days)
+
+    # Numbers of assets to try, exactly or at most fix_assets['num'] if given
+    max_size = min(math.floor(1 / gamma), fix_assets['num'] if fix_assets else len(V))
+    if fix_assets and fix_assets['constr'] == 'equality':
+        sizes = [fix_assets['num']]
+    else:
+        sizes = range(1, max_size + 1)
+
+    # Weights of selected positions within the LP budget, -inf once it is spent
+    num_lps = 0
+    def get_weights(selected):
+        nonlocal num_lps
+        if num_lps >= max_lps:
+            return -np.inf, None
+        obj_val, x, lps = _get_weights(mean_return, daily_returns, selected, config['R_var'], gamma, max_bad_days, max_day_swaps)
+        num_lps += lps
+        return obj_val, x
+
+    # Greedy independent sets by mean return, first of all assets then of assets feasible on their own
+    M = _get_diversification_matrix(G, cliques, config).tocsc()
+    order = np.argsort(-mean_return, kind='stable')
+    num_bad_days = np.sum(daily_returns < config['R_var'], axis=0)
+    safe_order = np.lexsort((-mean_return, num_bad_days > max_bad_days))
+
+    # Best prefix of greedy selections, prefixes grow until the objective stops improving
+    best = (-np.inf, None, None)
+    for _order in [order, safe_order]:
+        selected = _get_greedy_selection(M, _order, max_size)
+        previous_val = -np.inf
+        for k in sizes:
+            if k > len(selected):
+                break
+            obj_val, x = get_weights(selected[:k])
+            if obj_val > best[0]:
+                best = (obj_val, selected[:k], x)
+            if previous_val > -np.inf and obj_val <= previous_val:
+                break
+            previous_val = max(previous_val, obj_val)
+    if best[1] is None:
+        return {}
+
+    # Swap local search, replace a selected asset by a better compatible one while objective improves
+    obj_val, selected, x = best
+    for _ in range(max_swaps):
+        improved = False
+        for p in range(len(selected)):
+            others = selected[:p] + selected[p+1:]
+            covered = _get_covered(M, others)
+            candidates = [i for i in order if i not in selected and not covered[_get_rows(M, i)].any()]
+
+            for i in candidates[:num_candidates]:
+                swapped = others + [i]
+                swapped_val, swapped_x = get_weights(swapped)
+                if swapped_val > obj_val + 1e-12:
+                    obj_val, selected, x = swapped_val, swapped, swapped_x
+                    improved = True
+                    break
+            if improved:
+                break
+        if not improved or num_lps >= max_lps:
+            break
+
+    return {
+        'x': {V[p]: float(x_p) for p, x_p in zip(selected, x)},
+        'selected_idx': [V[p] for p in selected],
+        'obj_val': float(obj_val)
+    }
+
+
+def evaluate_solution(G, cliques, instance, config, delta, solution, tol=1e-6):
+    """
+    Return solution with its objective value on instance if it is feasible for G and instance,
+    empty otherwise (e.g., portfolio of a previous window)
+    """
+    V = G.nodes
+    position = {i: p for p, i in enumerate(V)}
+    selected_idx = solution.get('selected_idx', [])
+    if not selected_idx or any(i not in position for i in selected_idx):
+        return {}
+
+    # Weights and diversification of selected assets
+    x = np.array([solution['x'][i] for i in selected_idx])
+    y = np.zeros(len(V))
+    y[[position[i] for i in selected_idx]] = 1
+    M = _get_diversification_matrix(G, cliques, config)
+    if abs(x.sum() - 1) > tol or x.min() < config['gamma'] - tol or (M @ y).max() > 1:
+        return {}
+
+    # Bad days of chance constraint
+    portfolio_returns = instance.daily_returns[:, selected_idx] @ x
+    if np.sum(portfolio_returns < config['R_var'] - tol) > math.floor(delta * instance.total_days):
+        return {}
+
+    return {
+        'x': dict(zip(selected_idx, x.tolist())),
+        'selected_idx': list(selected_idx),
+        'obj_val': float(instance.mean_return[selected_idx] @ x)
+    }
+
+
+def _get_greedy_selection(M, order, max_size):
+    """
+    Return positions added greedily in order that keep M @ y <= 1
+    """
+    covered = np.zeros(M.shape[0], dtype=bool)
+    selected = []
+    for p in order:
+        if len(selected) >= max_size:
+            break
+        rows = _get_rows(M, p)
+        if not covered[rows].any():
+            selected.append(p)
+            covered[rows] = True
+
+    return selected
+
+
+def _get_covered(M, selected):
+    """
+    Return rows of M containing a selected position
+    """
+    covered = np.zeros(M.shape[0], dtype=bool)
+    for p in selected:
+        covered[_get_rows(M, p)] = True
+
+    return covered
+
+
+def _get_rows(M, p):
+    """
+    Return rows of column p of CSC matrix M
+    """
+    return M.indices[M.indptr[p]:M.indptr[p+1]]
+
+
+def _get_weights(mean_return, daily_returns, selected, R_var, gamma, max_bad_days, max_day_swaps):
+    """
+    Return objective value and weights of selected assets maximizing mean return, with R_var
+    reached on all but the max_bad_days worst days of the current weights, -inf if infeasible,
+    and number of LPs solved
+    """
+    k = len(selected)
+    num_lps = 0
+    if gamma * k > 1 + 1e-9:
+        return -np.inf, None, num_lps
+    mu = mean_return[selected]
+    R = daily_returns[:, selected]
+
+    # Start with gamma on every asset and the rest on the best one, equal weights if its worst days fail
+    x_best = np.full(k, gamma)
+    x_best[np.argmax(mu)] += 1 - gamma * k
+    for x in [x_best, np.full(k, 1 / k)]:
+        obj_val = -np.inf
+
+        # Swap bad days to the worst days of current weights until they do not change
+        bad_days = None
+        for _ in range(max_day_swaps):
+            new_bad_days = np.sort(np.argsort(R @ x, kind='stable')[:max_bad_days])
+            if bad_days is not None and np.array_equal(new_bad_days, bad_days):
+                break
+            bad_days = new_bad_days
+
+            good = np.ones(len(R), dtype=bool)
+            good[bad_days] = False
+            res = linprog(
+                -mu, A_ub=-R[good], b_ub=np.full(good.sum(), -R_var), A_eq=np.ones((1, k)), b_eq=[1],
+                bounds=(gamma, 1), method='highs'
+            )
+            num_lps += 1
+            if res.status != 0:
+                break
+            x, obj_val = res.x, -res.fun
+
+        if obj_val > -np.inf:
+            return obj_val, x, num_lps
+
+    return -np.inf, None, num_lps
\ No newline at end of file
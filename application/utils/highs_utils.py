@@ -0,0 +1,94 @@
+from utils.model_utils import *
+from scipy.optimize import milp, LinearConstraint, Bounds
+import numpy as np
+import time
+
+
+def build_model(form, config, flags):
+    """
+    Build HiGHS model from model form, scipy milp takes the whole model on every solve
+    so only the stacked constraint matrix is kept
+    """
+    A, _, _ = get_form_matrix(form)
+
+    return {'form': form, 'A': A, 'disp': flags['save_log']}
+
+
+def solve_model(model_data, incumbent=None):
+    """
+    Apply iteration settings of model form and solve, HiGHS has no callbacks so the shared
+    incumbent is only used as objective cutoff and lazy c1 rows are added by solving again
+    """
+    form = model_data['form']
+    start_time = time.perf_counter()
+    trajectory = []
+
+    while True:
+        _, sense, rhs = get_form_matrix(form)
+
+        # Raise objective cutoff (last row of model form) to incumbent found by another process
+        if incumbent is not None:
+            rhs[-1] = max(rhs[-1], incumbent.value)
+
+        # Row bounds lb <= A @ v <= ub from senses
+        lb, ub = get_row_bounds(sense, rhs)
+
+        # Solve, maximize by minimizing negative objective
+        time_limit = max(form['time_limit'] - (time.perf_counter() - start_time), 0)
+        options = {'time_limit': time_limit, 'disp': model_data['disp']}
+        res = milp(
+            -form['obj'], integrality=form['integrality'], bounds=Bounds(form['lb'], form['ub']),
+            constraints=LinearConstraint(model_data['A'], lb, ub), options=options
+        )
+
+        # Add incumbent and bound after every solve, None while undefined
+        obj_val = -res.fun if res.x is not None else None
+        obj_bound = -res.mip_dual_bound if getattr(res, 'mip_dual_bound', None) is not None else None
+        trajectory.append([time.perf_counter() - start_time, obj_val, obj_bound])
+
+        # Done if solution satisfies c1 rows of all days
+        if form['lazy_c1'] is None or res.x is None:
+            break
+        violated_days = get_violated_days(form, res.x)
+        if not len(violated_days):
+            break
+
+        # Add violated rows, solution is discarded if no time is left to solve again
+        add_lazy_rows(form, violated_days)
+        model_data['A'] = get_form_matrix(form)[0]
+        if time.perf_counter() - start_time >= form['time_limit']:
+            res.x, res.status = None, 1
+            break
+
+    solution = _get_solution(form, res)
+
+    # Set telemetry of solves, HiGHS reports no root relaxation time
+    if 'telemetry' in model_data:
+        solution['telemetry'] = {
+            'runtime': time.perf_counter() - start_time, 'node_count': getattr(res, 'mip_node_count', None),
+            'status': solution['status'], 'root_time': None, 'trajectory': trajectory
+        }
+
+    return solution
+
+
+def _get_solution(form, res):
+    """
+    Return solution dictionary from scipy milp result
+    """
+    obj_bound = -res.mip_dual_bound if getattr(res, 'mip_dual_bound', None) is not None else float('inf')
+
+    # Infeasible, no feasible objective value
+    if res.status in [2, 3]:
+        return get_form_solution(form, 'Inf', float('-inf'))
+
+    values = res.x
+    obj_val = -res.fun if res.x is not None else None
+    # Timed out
+    if res.status == 1:
+        return get_form_solution(form, 'TL', obj_bound, values, obj_val)
+    # Numerical or other solver failure, values are not trusted
+    if res.status != 0:
+        return get_form_solution(form, 'Error', obj_bound)
+    # Optimal Solution
+    return get_form_solution(form, 'Optimal', obj_bound, values, obj_val)
\ No newline at end of file
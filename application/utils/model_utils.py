@@ -0,0 +1,363 @@
+from scipy.optimize import milp, LinearConstraint, Bounds
+import scipy.sparse as sp
+import numpy as np
+import math
+
+
+def get_model_form(G, cliques, instance, config, delta):
+    """
+    Return maximum mean return model in sparse matrix form shared by all solver backends,
+    variables are stacked as [x, y, z] with x and y indexed by position in G.nodes
+    """
+    # Unpack instance data restricted to graph vertices
+    V = G.nodes
+    n = len(V)
+    total_days = instance.total_days
+    R_var = config['R_var']
+    gamma = config['gamma']
+    mean_return = instance.mean_return[V]
+
+    # Days of chance constraint, z[t] of merged days is weighted by their number of days
+    daily_returns = instance.daily_returns[:, V]
+    days, day_weights, min_daily_return, num_bad_days, day_reduction = _reduce_days(
+        daily_returns, instance.min_daily_return, R_var, config
+    )
+    if day_reduction:
+        daily_returns = daily_returns[days]
+    num_days = len(days)
+
+
+    # Decision variables: x continuous weights, y binary selection, z binary "bad days"
+    var_slices = {'x': slice(0, n), 'y': slice(n, 2*n), 'z': slice(2*n, 2*n + num_days)}
+    num_vars = 2*n + num_days
+    lb = np.zeros(num_vars)
+    ub = np.concatenate([np.full(n, np.inf), np.ones(n + num_days)])
+    integrality = np.concatenate([np.zeros(n), np.ones(n + num_days)])
+
+
+    # Objective function
+    obj = np.concatenate([mean_return, np.zeros(n + num_days)])
+
+
+    # Constraint blocks over columns [x, y, z]
+    I_n = sp.identity(n, format='csr')
+    O_x, O_y, O_z = (sp.csr_matrix((1, m)) for m in [n, n, num_days])
+    ones = lambda m: sp.csr_matrix(np.ones((1, m)))
+    constrs = {}
+
+    # c1: Enforce minimum daily portfolio return, less strict on "bad days" (z[t]=1)
+    c1 = _get_block(
+        [sp.csr_matrix(daily_returns, dtype=np.float64), sp.csr_matrix((num_days, n)), sp.diags(R_var - min_daily_return)],
+        '>', R_var
+    )
+    # In lazy mode start from days with lowest mean return over V, other days are separated while solving
+    if config['c1_mode'] == 'eager':
+        constrs['c1'], lazy_c1 = c1, None
+    else:
+        initial_days = np.sort(np.argsort(daily_returns.mean(axis=1), kind='stable')[:math.ceil(num_days / 4)])
+        lazy_c1 = {**c1, 'active': np.zeros(num_days, dtype=bool), 'node': config['c1_mode'] == 'lazy_node'}
+        lazy_c1['active'][initial_days] = True
+        constrs['c1'] = _get_rows(c1, initial_days)
+    # c2: Limit the proportion or count of "bad days" (days where portfolio return is below R_var), fixed "bad days" included.
+    z_weights = sp.csr_matrix(day_weights.reshape(1, -1))
+    if config['delta_constr'] == 'inequality':
+        constrs['c2'] = _get_block([O_x, O_y, z_weights / total_days], '<', _get_c2_rhs(config, delta, total_days, num_bad_days))
+    elif config['delta_constr'] == 'equality':
+        constrs['c2'] = _get_block([O_x, O_y, z_weights], '=', _get_c2_rhs(config, delta, total_days, num_bad_days))
+    # c3: Ensure the sum of all asset weights in the portfolio equals 1.
+    constrs['c3'] = _get_block([ones(n), O_y, O_z], '=', 1)
+    # c4: Asset diversification, prevent selecting highly correlated assets based on graph structure (G is G2 from main).
+    # Rows of isolated vertices only bound y[i] <= 1 and are dropped.
+    M = _get_diversification_matrix(G, cliques, config)
+    M = M[M.getnnz(axis=1) > 1]
+    constrs['c4'] = _get_block([sp.csr_matrix(M.shape), M, sp.csr_matrix((M.shape[0], num_days))], '<', 1)
+    # c5: If an asset 'i' is selected (y[i]=1), its weight x[i] must be at least gamma.
+    constrs['c5'] = _get_block([-I_n, gamma * I_n, sp.csr_matrix((n, num_days))], '<', 0)
+    # c6: Asset weight x[i] is 0 if not selected (y[i]=0), and at most 1 if selected (y[i]=1).
+    constrs['c6'] = _get_block([I_n, -I_n, sp.csr_matrix((n, num_days))], '<', 0)
+    # c7: If 'valid_day_constr' is 'upfront', ensure on "good days" (z[t]=0) at least one selected asset met R_var.
+    if config['valid_day_constr']:
+        S = sp.csr_matrix(daily_returns >= R_var, dtype=np.float64)
+        constrs['c7'] = _get_block([sp.csr_matrix((num_days, n)), S, sp.identity(num_days)], '>', 1)
+    # c8: Total number of selected assets, fixed or limited by update_model_form (e.g., in iterative solver).
+    constrs['c8'] = _get_block([O_x, ones(n), O_z], '<', n)
+    # c9: If 'day_reduction', a day with returns at least those of another day on V is a "bad day" only if the other one is.
+    if day_reduction:
+        dominant_days, dominated_days = _get_day_dominance(daily_returns)
+        rows = np.arange(len(dominant_days))
+        Z = sp.csr_matrix(
+            (np.repeat([1.0, -1.0], len(rows)), (np.tile(rows, 2), np.concatenate([dominant_days, dominated_days]))),
+            shape=(len(rows), num_days)
+        )
+        constrs['c9'] = _get_block([sp.csr_matrix((len(rows), n)), sp.csr_matrix((len(rows), n)), Z], '<', 0)
+    # Objective cutoff from warmstart solution, set by update_model_form.
+    constrs['cutoff'] = _get_block([sp.csr_matrix(mean_return), O_y, O_z], '>', -np.inf)
+
+    return {
+        'V': V, 'vars': var_slices, 'num_vars': num_vars, 'lb': lb, 'ub': ub,
+        'integrality': integrality, 'obj': obj, 'constrs': constrs, 'day_reduction': day_reduction,
+        'lazy_c1': lazy_c1, 'total_days': total_days, 'num_bad_days': num_bad_days
+    }
+
+
+def update_model_form(form, config, opt_config={}):
+    """
+    Update time limit, warmstart, objective cutoff, c2 and c8 of a model form in place
+    """
+    V, var_slices, constrs = form['V'], form['vars'], form['constrs']
+
+    # Set time limit
+    form['time_limit'] = opt_config.get('time_limit', config['time_limit'])
+
+    # Set warmstart, nan for undefined start values
+    form['start'] = np.full(form['num_vars'], np.nan)
+    if opt_config.get('warmstart_solution', {}).get('x'):
+        _solution = opt_config['warmstart_solution']
+        form['start'][var_slices['x']], form['start'][var_slices['y']] = _get_start(V, _solution)
+        constrs['cutoff']['rhs'][:] = _solution['obj_val']
+        form['bound_stop'] = _solution['obj_val'] - 1e-6
+    else:
+        constrs['cutoff']['rhs'][:] = -np.inf
+        form['bound_stop'] = np.inf
+
+        # Start from heuristic solution without cutoff, it may be optimal
+        if opt_config.get('start_solution', {}).get('x'):
+            form['start'][var_slices['x']], form['start'][var_slices['y']] = _get_start(V, opt_config['start_solution'])
+
+    # c2: If 'delta' is specified (e.g., in frontier solver), set the limit of "bad days" for it.
+    if 'delta' in opt_config and 'c2' in constrs:
+        constrs['c2']['rhs'][:] = _get_c2_rhs(config, opt_config['delta'], form['total_days'], form['num_bad_days'])
+
+    # c8: If 'fix_assets' is specified (e.g., in iterative solver), fix the total number of selected assets.
+    if opt_config.get('fix_assets'):
+        constrs['c8']['rhs'][:] = opt_config['fix_assets']['num']
+        constrs['c8']['sense'][:] = '=' if opt_config['fix_assets']['constr'] == 'equality' else '<'
+    else:
+        constrs['c8']['rhs'][:] = len(V)
+        constrs['c8']['sense'][:] = '<'
+
+
+def get_form_solution(form, status, obj_bound, values=None, obj_val=None):
+    """
+    Return solution dictionary from backend status and variable values
+    """
+    V, var_slices = form['V'], form['vars']
+
+    # Optimal solution has no bound
+    if status == 'Optimal':
+        solution = {'solved': True}
+    else:
+        solution = {'solved': status not in ['TL', 'Error'], 'obj_bound': obj_bound}
+
+    # If found solution
+    if values is not None:
+        solution['x'] = dict(zip(V, values[var_slices['x']].tolist()))
+        solution['selected_idx'] = [i for i, y_i in zip(V, values[var_slices['y']]) if y_i > 0.5]
+        solution['obj_val'] = obj_val
+    solution['status'] = status
+
+    # Report day reduction of model
+    if form['day_reduction']:
+        solution['day_reduction'] = form['day_reduction']
+
+    return solution
+
+
+def get_form_size(form):
+    """
+    Return number of variables, constraints and nonzeros of model form
+    """
+    constrs = form['constrs'].values()
+
+    return {
+        'num_vars': form['num_vars'],
+        'num_constrs': sum(c['A'].shape[0] for c in constrs),
+        'num_nonzeros': sum(c['A'].nnz for c in constrs)
+    }
+
+
+def get_form_matrix(form):
+    """
+    Return all constraint blocks stacked in one sparse matrix with row senses and right hand sides
+    """
+    constrs = form['constrs'].values()
+    A = sp.vstack([c['A'] for c in constrs], format='csr')
+    sense = np.concatenate([c['sense'] for c in constrs])
+    rhs = np.concatenate([c['rhs'] for c in constrs])
+
+    return A, sense, rhs
+
+
+def get_row_bounds(sense, rhs):
+    """
+    Return row bounds lb <= A @ v <= ub from row senses and right hand sides
+    """
+    lb = np.where(sense == '<', -np.inf, rhs)
+    ub = np.where(sense == '>', np.inf, rhs)
+
+    return lb, ub
+
+
+def solve_form_relaxation(form):
+    """
+    Return optimal objective value of LP relaxation of model form, -inf if infeasible
+    """
+    A, sense, rhs = get_form_matrix(form)
+    res = milp(
+        -form['obj'], bounds=Bounds(form['lb'], form['ub']),
+        constraints=LinearConstraint(A, *get_row_bounds(sense, rhs))
+    )
+
+    # Infeasible
+    if res.status == 2:
+        return float('-inf')
+    # Not solved, no bound
+    if res.status != 0:
+        return float('inf')
+
+    return -res.fun
+
+
+def get_violated_days(form, values, tol=1e-6):
+    """
+    Return days whose c1 row is not in the model and is violated by values of all variables
+    """
+    lazy_c1 = form['lazy_c1']
+    violated = lazy_c1['A'] @ values < lazy_c1['rhs'] - tol
+
+    return np.flatnonzero(violated & ~lazy_c1['active'])
+
+
+def add_lazy_rows(form, days):
+    """
+    Add c1 rows of days to model form and return them as a block
+    """
+    lazy_c1, c1 = form['lazy_c1'], form['constrs']['c1']
+    rows = _get_rows(lazy_c1, days)
+    lazy_c1['active'][days] = True
+
+    form['constrs']['c1'] = {
+        'A': sp.vstack([c1['A'], rows['A']], format='csr'),
+        'sense': np.concatenate([c1['sense'], rows['sense']]),
+        'rhs': np.concatenate([c1['rhs'], rows['rhs']])
+    }
+
+    return rows
+
+
+def _reduce_days(daily_returns, min_daily_return, R_var, config):
+    """
+    Return kept days, number of days merged into each, their minimum return, number of fixed "bad days"
+    and reduction statistics. Days where no asset of V reaches R_var are fixed "bad days", days where
+    all assets reach it are fixed good days and identical days are merged (inequality only, equality
+    may need them as "bad days" and a subset of merged days to reach its exact count)
+    """
+    total_days, n = daily_returns.shape
+    if not config['day_reduction'] or n == 0:
+        return np.arange(total_days), np.ones(total_days), min_daily_return, 0, {}
+
+    # Fix days decided by every portfolio of V
+    bad_days = daily_returns.max(axis=1) < R_var
+    good_days = (daily_returns.min(axis=1) >= R_var) & ~bad_days & (config['delta_constr'] == 'inequality')
+    free_days = np.flatnonzero(~bad_days & ~good_days)
+
+    # Keep free days unmerged for equality
+    if config['delta_constr'] == 'equality':
+        stats = {'fixed_bad_days': int(bad_days.sum()), 'fixed_good_days': 0, 'merged_days': 0}
+        return free_days, np.ones(len(free_days)), min_daily_return[free_days], stats['fixed_bad_days'], stats
+
+    # Merge identical days keeping first occurrence order, minimum return of merged days for c1
+    _, first, inverse, counts = np.unique(
+        daily_returns[free_days], axis=0, return_index=True, return_inverse=True, return_counts=True
+    )
+    order = np.argsort(first)
+    min_merged = np.full(len(first), np.inf)
+    np.minimum.at(min_merged, inverse.ravel(), min_daily_return[free_days])
+
+    stats = {
+        'fixed_bad_days': int(bad_days.sum()),
+        'fixed_good_days': int(good_days.sum()),
+        'merged_days': len(free_days) - len(first)
+    }
+
+    return free_days[first[order]], counts[order].astype(np.float64), min_merged[order], stats['fixed_bad_days'], stats
+
+
+def _get_day_dominance(daily_returns):
+    """
+    Return pairs of days (s, t) where day s has a return at least that of day t for every asset, identical
+    days in index order only and without pairs implied by transitivity. Some optimal solution has
+    z[s] <= z[t] for all pairs: lowest return days of a portfolio can always be its "bad days"
+    """
+    num_days = len(daily_returns)
+    dominance = np.zeros((num_days, num_days), dtype=bool)
+    for s in range(num_days):
+        dominance[s] = (daily_returns[s] >= daily_returns).all(axis=1)
+
+    # Identical days dominate only later days, no day dominates itself
+    dominance &= ~np.tril(dominance & dominance.T)
+
+    # Remove pairs through an intermediate day
+    weights = dominance.astype(np.float32)
+    dominance &= ~((weights @ weights) > 0)
+
+    return np.nonzero(dominance)
+
+
+def _get_c2_rhs(config, delta, total_days, num_bad_days):
+    """
+    Return right hand side of c2 for delta, without fixed "bad days"
+    """
+    if config['delta_constr'] == 'equality':
+        return math.floor(delta * total_days) - num_bad_days
+
+    return delta - num_bad_days / total_days
+
+
+def _get_block(blocks, sense, rhs):
+    """
+    Return constraint block [A_x, A_y, A_z] (sense) rhs with one sense and right hand side per row
+    """
+    A = sp.hstack(blocks, format='csr')
+
+    return {'A': A, 'sense': np.full(A.shape[0], sense), 'rhs': np.full(A.shape[0], rhs, dtype=np.float64)}
+
+
+def _get_rows(block, rows):
+    """
+    Return rows of a constraint block
+    """
+    return {'A': block['A'][rows], 'sense': block['sense'][rows], 'rhs': block['rhs'][rows]}
+
+
+def _get_diversification_matrix(G, cliques, config):
+    """
+    Return sparse matrix M of diversification constraints M @ y <= 1 over positions of G.nodes
+    """
+    V = G.nodes
+
+    # Allow at most one asset from any maximal clique in the power graph G2, one row per clique
+    if config['dist_constr'] == 'clique':
+        position = {i: p for p, i in enumerate(V)}
+        rows = np.repeat(np.arange(len(cliques)), [len(c) for c in cliques])
+        cols = [position[i] for c in cliques for i in c]
+        return sp.csr_matrix((np.ones(len(cols)), (rows, cols)), shape=(len(cliques), len(V)))
+
+    # If asset 'i' is selected, none of its neighbors in power graph G2 can be selected (independent set)
+    A = G.adjacency[V][:, V]
+    return sp.identity(len(V), format='csr') + sp.csr_matrix(A, dtype=np.float64)
+
+
+def _get_start(V, solution):
+    """
+    Return start vectors of x and y from a solution, nan for unselected assets
+    """
+    x_start = np.full(len(V), np.nan)
+    y_start = np.full(len(V), np.nan)
+    position = {i: p for p, i in enumerate(V)}
+
+    for i in solution['selected_idx']:
+        x_start[position[i]] = solution['x'][i]
+        y_start[position[i]] = 1
+
+    return x_start, y_start
\ No newline at end of file
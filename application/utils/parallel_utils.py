@@ -0,0 +1,59 @@
+from utils.solve_utils import *
+from classes.Timer import *
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+def solve_jobs(jobs, config, flags):
+    """
+    Solve independent (partition, threshold, delta) jobs, yielding results as they finish
+    """
+    # Solve sequentially in current process
+    if config['workers'] <= 1:
+        for job in jobs:
+            yield _solve_job(job, config, flags)
+        return
+
+    # Solve in process pool, cores are shared with iteration processes of each job
+    num_processes = config['workers'] * (config['iter_workers'] if config['iterative_warmstart'] else 1)
+    config = get_worker_config(config, num_processes)
+    with ProcessPoolExecutor(max_workers=config['workers']) as executor:
+        futures = [executor.submit(_solve_job_group, group, config, flags) for group in _get_job_groups(jobs)]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def _get_job_groups(jobs):
+    """
+    Return jobs grouped by partition and threshold, so graph, cliques and instance of a group are sent
+    to a process once and graph caches (e.g., presolve) are reused between its deltas
+    """
+    groups = {}
+    for job in jobs:
+        groups.setdefault(job['key'][:-1], []).append(job)
+
+    # Instance without dense matrices, solving does not use them
+    for group in groups.values():
+        instance = group[0]['instance'].get_solve_copy()
+        group[:] = [{**job, 'instance': instance} for job in group]
+
+    return list(groups.values())
+
+
+def _solve_job_group(jobs, config, flags):
+    """
+    Solve jobs of a group one after another in a pool process
+    """
+    return [_solve_job(job, config, flags) for job in jobs]
+
+
+def _solve_job(job, config, flags):
+    """
+    Solve optimal portfolio of a job and measure its runtime
+    """
+    timer = Timer()
+    timer.reset()
+    solution = solve_max_return(job['G2'], job['cliques'], job['instance'], config, flags, job['delta'])
+    timer.mark()
+    timer.update()
+
+    return job['key'], solution, timer.runtimes[0]
\ No newline at end of file
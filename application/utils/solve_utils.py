@@ -1,130 +1,253 @@
 from utils.calculation_utils import *
+from utils.model_utils import *
+from utils.graph_utils import *
+from utils.heuristic_utils import *
+from utils.cache_utils import *
 from classes.Timer import *
-import gurobipy as gp
-from gurobipy import GRB
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing as mp
 import numpy as np
-import math
+import importlib
 import os
+import math
+import time
+
+
+# Model arguments, built model and shared incumbent of a concurrent iteration worker process
+_worker_data = {}
 
 
-def solve_max_return(G, cliques, instance, config, flags, delta=0.65):
+def solve_max_return(G, cliques, instance, config, flags, delta=0.65, start_solution={}):
     """
-    Solve for maximum mean return, different methods depending on config
+    Solve for maximum mean return, different methods depending on config, starting from
+    start_solution if it is feasible (e.g., portfolio of previous backtest window). Solved
+    solutions are cached and loaded for the same graph, daily returns and settings
     """
+    # Get cached solution, without telemetry since nothing is solved
+    cache = get_cache(config)
+    if cache is not None:
+        cache_key = get_solution_key(G, instance, config, delta)
+        solution = cache.get(cache_key)
+        if solution is not None:
+            if config['telemetry']:
+                solution['telemetry'] = {'presolve_time': 0.0, **_get_telemetry()}
+            return solution
+
+    # Remove dominated vertices and their cliques entries
+    start_time = time.perf_counter()
+    if config['presolve']:
+        G, stats = presolve_graph(G, instance)
+        cliques = _get_presolved_cliques(G, cliques)
+    presolve_time = time.perf_counter() - start_time
+
+    # Keep start solution only if feasible
+    if start_solution:
+        start_solution = evaluate_solution(G, cliques, instance, config, delta, start_solution)
+
     if config['iterative_warmstart']:
-        return _solve_iterative(G, cliques, instance, config, flags, delta)
+        solution = _solve_iterative(G, cliques, instance, config, flags, delta, start_solution)
     else:
-        return _solve(G, cliques, instance, config, flags, delta)
+        solution = _solve(G, cliques, instance, config, flags, delta, {'start_solution': start_solution})
+
+    if config['presolve']:
+        solution['presolve'] = stats
+    if cache is not None and solution['status'] in ['Optimal', 'Inf']:
+        cache.set(cache_key, {k: v for k, v in solution.items() if k != 'telemetry'})
+    if config['telemetry']:
+        solution['telemetry'] = {'presolve_time': presolve_time, **solution['telemetry']}
+
+    return solution
+
+
+def solve_frontier(G, cliques, instance, config, flags, deltas, R_vars):
+    """
+    Return maximum mean return solutions of every (delta, R_var) point of a grid. R_var is swept from
+    tightest to loosest with one model per R_var, whose c2 is updated for each delta, so solutions
+    of previous points stay feasible as starts. The loosest delta is solved first, its objective bounds
+    the other deltas and its solution is optimal for every delta it is feasible for
+    """
+    # Remove dominated vertices once for all points
+    start_time = time.perf_counter()
+    if config['presolve']:
+        G, stats = presolve_graph(G, instance)
+        cliques = _get_presolved_cliques(G, cliques)
+    presolve_time = time.perf_counter() - start_time
+
+    deltas = sorted(deltas)
+    solutions = {}
+    previous_R_var = None
+    for R_var in sorted(R_vars, reverse=True):
+        row_config = {**config, 'R_var': R_var}
+        model_data = _build_model(G, cliques, instance, row_config, flags, deltas[-1])
+        telemetry = _get_telemetry(model_data)
+
+        for delta in [deltas[-1]] + deltas[:-1]:
+            loosest_solution = solutions.get((deltas[-1], R_var), {})
+
+            # Bound of loosest delta is reached by its solution or it is infeasible
+            if loosest_solution.get('status') == 'Optimal':
+                solution = evaluate_solution(G, cliques, instance, row_config, delta, loosest_solution)
+                solution = {'solved': True, **solution, 'status': 'Optimal'} if solution else {}
+            elif loosest_solution.get('status') == 'Inf':
+                solution = {'solved': True, 'obj_bound': loosest_solution['obj_bound'], 'status': 'Inf'}
+            else:
+                solution = {}
+
+            # Solve from best feasible solution of lower delta or higher R_var
+            if not solution:
+                starts = [solutions.get((delta, previous_R_var), {}), *(s for (d, r), s in solutions.items() if r == R_var and d < delta)]
+                start_solution = _get_best_start(G, cliques, instance, row_config, delta, starts)
+                start_solution = _get_start_solution(G, cliques, instance, row_config, delta, {}, start_solution)
+                solution = _solve_model(model_data, row_config, {'delta': delta, 'start_solution': start_solution})
+                _add_solve_telemetry(telemetry, solution)
+
+            # Set telemetry of point, model build and presolve are counted once
+            if config['presolve']:
+                solution['presolve'] = stats
+            if config['telemetry']:
+                solution['telemetry'] = {'presolve_time': presolve_time, **telemetry}
+                presolve_time = 0.0
+            telemetry = _get_telemetry()
+            solutions[delta, R_var] = solution
+
+        previous_R_var = R_var
+
+    return solutions
+
+
+def _get_presolved_cliques(G, cliques):
+    """
+    Return cliques restricted to vertices kept by presolve
+    """
+    kept = set(G.nodes)
+    cliques = (tuple(i for i in c if i in kept) for c in cliques)
+
+    return [c for c in cliques if c]
 
 
 def _solve(G, cliques, instance, config, flags, delta, opt_config={}):
     """
     Solve for maximum mean return
     """
-    # Unpack instance data
-    (assets, daily_returns, min_daily_return, mean_return,
-     correlation_matrix, sigma, asset_pairs, total_days) = instance
-    R_var = config['R_var']
-    gamma = config['gamma']
-    V = G.nodes
-    T_range = range(total_days)
+    # Build model
+    model_data = _build_model(G, cliques, instance, config, flags, delta)
 
+    # Start from better of given and heuristic solution
+    start_solution = _get_start_solution(G, cliques, instance, config, delta, opt_config, opt_config.get('start_solution', {}))
+    opt_config = {**opt_config, 'start_solution': start_solution}
 
-    # Create model
-    model = gp.Model("Max_Return")
-    model.setParam('TimeLimit', opt_config.get('time_limit', config['time_limit']))
-    _save_log(model, flags['save_log'])
+    solution = _solve_model(model_data, config, opt_config)
 
+    # Set telemetry of model build and solve
+    telemetry = _get_telemetry(model_data)
+    _add_solve_telemetry(telemetry, solution)
+    if config['telemetry']:
+        solution['telemetry'] = telemetry
+
+    return solution
 
-    # Add decision variables
-    x = model.addVars(V, vtype=GRB.CONTINUOUS, name="x")
-    y = model.addVars(V, vtype=GRB.BINARY, name="y")
-    z = model.addVars(T_range, vtype=GRB.BINARY, name="z")
 
+def _solve_model(model_data, config, opt_config={}, incumbent=None):
+    """
+    Update iteration settings of a built model and solve it
+    """
+    # Update model form
+    update_model_form(model_data['form'], config, opt_config)
 
-    # Set objective function
-    obj_fn = gp.quicksum(mean_return[i] * x[i] for i in V)
-    model.setObjective(obj_fn, GRB.MAXIMIZE)
+    # Solve
+    return _get_backend(config).solve_model(model_data, incumbent)
 
 
-    # Set warmstart
+def _build_model(G, cliques, instance, config, flags, delta):
+    """
+    Build maximum mean return model of solver backend from sparse matrix model form,
+    settings that change between iterations are set by _solve_model
+    """
+    start_time = time.perf_counter()
+    form = get_model_form(G, cliques, instance, config, delta)
+    model_data = _get_backend(config).build_model(form, config, flags)
+
+    if config['telemetry']:
+        model_data['telemetry'] = {'build_time': time.perf_counter() - start_time, **get_form_size(form)}
+
+    return model_data
+
+
+def _get_start_solution(G, cliques, instance, config, delta, opt_config, start_solution={}):
+    """
+    Return better of start solution and heuristic solution if enabled, empty if there is a warmstart solution
+    """
     if opt_config.get('warmstart_solution', {}).get('x'):
-        _solution = opt_config['warmstart_solution']
-        for i in _solution['selected_idx']:
-            x[i].Start = _solution['x'][i]
-            y[i].Start = 1
-        model.addConstr(obj_fn >= _solution['obj_val'])
-        model.setParam(GRB.Param.BestBdStop, _solution['obj_val']-1e-6)
-
-
-    # Add constraints
-    # c1: Enforce minimum daily portfolio return, less strict on "bad days" (z[t]=1)
-    model.addConstrs(
-        (gp.quicksum(daily_returns[t, i] * x[i] for i in V) >= R_var - (R_var - min_daily_return[t]) * z[t]
-        for t in T_range),
-        name="c1"
-    )
-    # c2: Limit the proportion or count of "bad days" (days where portfolio return is below R_var).
-    if config['delta_constr'] == 'inequality':
-        model.addConstr(gp.quicksum(z[t] for t in T_range) / total_days <= delta, name="c2")
-    elif config['delta_constr'] == 'equality':
-        model.addConstr(gp.quicksum(z[t] for t in T_range) == math.floor(delta * total_days), name="c2")
-    # c3: Ensure the sum of all asset weights in the portfolio equals 1.
-    model.addConstr(gp.quicksum(x[i] for i in V) == 1, name="c3")
-    # Asset diversification: Prevent selecting highly correlated assets based on graph structure (G is G2 from main).
-    if config['dist_constr'] == 'clique':
-        # Allow at most one asset from any maximal clique in the power graph G2.
-        model.addConstrs((gp.quicksum(y[i] for i in c) <= 1 for c in cliques))
-    elif config['dist_constr'] == 'star':
-        # If asset 'i' is selected, none of its neighbors in power graph G2 can be selected (independent set).
-        model.addConstrs((y[i] + gp.quicksum(y[j] for j in G.neighbors(i)) <= 1 for i in V))
-    # c5: If an asset 'i' is selected (y[i]=1), its weight x[i] must be at least gamma.
-    model.addConstrs((gamma * y[i] <= x[i] for i in V), name="c5")
-    # c6: Asset weight x[i] is 0 if not selected (y[i]=0), and at most 1 if selected (y[i]=1).
-    model.addConstrs((x[i] <= y[i] for i in V), name="c6")
-    # c7: If 'valid_day_constr' is 'upfront', ensure on "good days" (z[t]=0) at least one selected asset met R_var.
-    if config['valid_day_constr']:
-        S = {t: [i for i in V if daily_returns[t, i] >= R_var] for t in T_range}
-        model.addConstrs((gp.quicksum(y[i] for i in S[t]) >= 1 - z[t] for t in T_range), name="c7")
-    # c8: If 'numOfselectedAssets' is specified (e.g., in iterative solver), fix the total number of selected assets.
-    if opt_config.get('fix_assets'):
-        k = opt_config['fix_assets']['num']
-        if opt_config['fix_assets']['constr'] == 'equality':
-            model.addConstr(gp.quicksum(y[i] for i in V) == k, name="c8")
-        else:
-            model.addConstr(gp.quicksum(y[i] for i in V) <= k, name="c8")
-    
-    # Solve
-    model.optimize()
-
-    # Infeasible
-    if model.status in [3, 4, 15]:
-        solution =  {'solved': True, 'obj_bound': model.ObjBound, 'status': 'Inf'}
-    # Timed out
-    elif model.status == 9:
-        solution = {'solved': False, 'obj_bound': model.ObjBound, 'status': 'TL'}
-        # If found solution
-        if model.SolCount > 0:
-            weights = {i: x[i].X for i in V}
-            selected_idx = [i for i in V if y[i].X > 0.5]
-            solution['x'] = weights
-            solution['selected_idx'] = selected_idx
-            solution['obj_val'] = model.ObjVal
-    # Optimal Solution
-    else:
-        weights = {i: x[i].X for i in V}
-        selected_idx = [i for i in V if y[i].X > 0.5]
-        solution = {'solved': True, 'x': weights, 'selected_idx': selected_idx, 'obj_val': model.ObjVal, 'status': 'Optimal'}
+        return {}
+    if not config['heuristic_start']:
+        return start_solution
 
+    heuristic_solution = get_heuristic_solution(G, cliques, instance, config, delta, opt_config.get('fix_assets'))
+    if heuristic_solution.get('obj_val', float('-inf')) > start_solution.get('obj_val', float('-inf')):
+        return heuristic_solution
 
-    return solution
+    return start_solution
+
+
+def _get_best_start(G, cliques, instance, config, delta, starts):
+    """
+    Return feasible start with maximum objective value, empty if none is feasible
+    """
+    best_start = {}
+    for start in starts:
+        start = evaluate_solution(G, cliques, instance, config, delta, start) if start.get('x') else {}
+        if start.get('obj_val', float('-inf')) > best_start.get('obj_val', float('-inf')):
+            best_start = start
+
+    return best_start
+
+
+def _get_telemetry(model_data=None):
+    """
+    Return job telemetry with builds and solves of its models
+    """
+    return {'builds': [model_data['telemetry']] if model_data and 'telemetry' in model_data else [], 'solves': []}
+
+
+def _add_solve_telemetry(telemetry, solution, k=None):
+    """
+    Move telemetry of a model solve, and of the model build done for it, from solution to job telemetry
+    """
+    solve_telemetry = solution.pop('telemetry', None)
+    if solve_telemetry is None:
+        return
+
+    if 'build' in solve_telemetry:
+        telemetry['builds'].append(solve_telemetry.pop('build'))
+    telemetry['solves'].append({'k': k, **solve_telemetry})
+
+
+def get_worker_config(config, num_workers):
+    """
+    Return config of a pool of num_workers processes, default gurobi threads are an equal share of cores
+    so processes do not oversubscribe them
+    """
+    if config['threads'] or num_workers <= 1:
+        return config
+
+    return {**config, 'threads': max(1, (os.cpu_count() or 1) // num_workers)}
 
 
-def _solve_iterative(G, cliques, instance, config, flags, delta):
+def _get_backend(config):
     """
-    Solve the asset allocation problem using an iterative warm-start strategy
+    Return solver backend module, imported only when selected so gurobipy is not required for HiGHS
     """
+    return importlib.import_module(f"utils.{config['backend']}_utils")
+
+
+def _solve_iterative(G, cliques, instance, config, flags, delta, start_solution={}):
+    """
+    Solve the asset allocation problem using an iterative warm-start strategy,
+    a feasible start solution is the first best solution
+    """
+    if config['iter_workers'] > 1:
+        return _solve_iterative_concurrent(G, cliques, instance, config, flags, delta, start_solution)
+
     # Set config for iterations
     opt_config = {
         'time_limit': 300,
@@ -133,12 +256,18 @@ def _solve_iterative(G, cliques, instance, config, flags, delta):
     }
 
     # Set params
-    best_solution = {'obj_val': float('-inf')}
+    start_time = time.perf_counter()
+    best_solution = _get_initial_solution(start_solution)
     max_num_of_assets = _solve_max_num_of_assets(G, config)
-    upper_bounds = [_solve_ub(instance, config, k) for k in range(1, max_num_of_assets+1)]
+    upper_bounds = _solve_ubs(G, cliques, instance, config, delta, max_num_of_assets)
+    bounds_time = time.perf_counter() - start_time
     solutions = [{} for _ in range(max_num_of_assets)]
     _timer = Timer(opt_config['time_limit'])
 
+    # Build model once, iterations only update it
+    model_data = _build_model(G, cliques, instance, config, flags, delta)
+    telemetry = {'bounds_time': bounds_time, **_get_telemetry(model_data)}
+
     # Solve bottom-up
     _timer.reset()
     for k in range(1, max_num_of_assets+1):
@@ -150,7 +279,9 @@ def _solve_iterative(G, cliques, instance, config, flags, delta):
         if upper_bounds[k-1] < best_solution['obj_val']:
             current_solution = {'solved': True, 'obj_bound': upper_bounds[k-1], 'status': 'Inf-Ub'}
         else:
-            current_solution = _solve(G, cliques, instance, config, flags, delta, opt_config)
+            opt_config['start_solution'] = _get_start_solution(G, cliques, instance, config, delta, opt_config)
+            current_solution = _solve_model(model_data, config, opt_config)
+            _add_solve_telemetry(telemetry, current_solution, k)
         _timer.mark()
 
         # Update solutions and current best solution
@@ -179,7 +310,9 @@ def _solve_iterative(G, cliques, instance, config, flags, delta):
         if upper_bounds[k-1] < best_solution['obj_val']:
             current_solution = {'solved': True, 'obj_bound': upper_bounds[k-1], 'status': 'Inf-Ub'}
         else:
-            current_solution = _solve(G, cliques, instance, config, flags, delta, opt_config)
+            opt_config['start_solution'] = _get_start_solution(G, cliques, instance, config, delta, opt_config)
+            current_solution = _solve_model(model_data, config, opt_config)
+            _add_solve_telemetry(telemetry, current_solution, k)
         _timer.mark()
 
         # Update solutions and current best solution
@@ -189,59 +322,152 @@ def _solve_iterative(G, cliques, instance, config, flags, delta):
 
 
     # Set iteration warmstart results to solution
-    best_solution = _set_iter_results(best_solution, solutions, _timer)
+    best_solution = _set_iter_results(best_solution, solutions, _timer.runtimes_list)
+    if config['telemetry']:
+        best_solution['telemetry'] = telemetry
 
     return best_solution
 
 
-def _solve_max_num_of_assets(G2, config):
+def _solve_iterative_concurrent(G, cliques, instance, config, flags, delta, start_solution={}):
     """
-    Solve maximum number of assets possible
+    Solve the iterative warm-start strategy with several k at once in separate processes,
+    sharing the best objective value so that running models stop once they cannot improve it
     """
-    gamma = config['gamma']
-    V = G2.nodes
+    # Set params
+    start_time = time.perf_counter()
+    best_solution = _get_initial_solution(start_solution)
+    max_num_of_assets = _solve_max_num_of_assets(G, config)
+    upper_bounds = _solve_ubs(G, cliques, instance, config, delta, max_num_of_assets)
+    telemetry = {'bounds_time': time.perf_counter() - start_time, **_get_telemetry()}
+    solutions = [{'solved': False} for _ in range(max_num_of_assets)]
+    runtimes = [0.0] * max_num_of_assets
+    iteration_passes = [(300, 'equality'), (600, 'inequality')]
+
+    # Best objective value shared with worker processes
+    incumbent = mp.Value('d', best_solution['obj_val'])
+    worker_args = ((G, cliques, instance.get_solve_copy(), get_worker_config(config, config['iter_workers']), flags, delta), upper_bounds, incumbent)
+
+    with ProcessPoolExecutor(config['iter_workers'], initializer=_init_iteration_worker, initargs=worker_args) as executor:
+        # Solve bottom-up, then unsolved cases with more effort
+        for iteration_pass, (time_limit, constr) in enumerate(iteration_passes):
+            futures = {}
+            for k in range(1, max_num_of_assets+1):
+                # Skip if already solved
+                if solutions[k-1]['solved']:
+                    continue
+
+                # Set config for iteration
+                opt_config = {
+                    'time_limit': time_limit,
+                    'warmstart_solution': best_solution,
+                    'fix_assets': {'num': k, 'constr': constr}
+                }
+                opt_config['start_solution'] = _get_start_solution(G, cliques, instance, config, delta, opt_config)
+                futures[executor.submit(_solve_iteration, k, opt_config)] = k
+
+            # Runtimes are measured in worker processes, results finish in any order of k
+            for future in as_completed(futures):
+                k = futures[future]
+                current_solution, runtime = future.result()
+                _add_solve_telemetry(telemetry, current_solution, k)
+                runtimes[k-1] += runtime
+
+                # Update solutions, current best solution and shared incumbent
+                solutions[k-1] = current_solution
+                best_solution = _get_best_solution(best_solution, current_solution, k)
+                with incumbent.get_lock():
+                    incumbent.value = max(incumbent.value, best_solution['obj_val'])
+
+            # Update solution unsolved cases after first pass
+            if iteration_pass == 0:
+                solutions = _update_solutions(best_solution, solutions)
+
+    # Set iteration warmstart results to solution, runtimes of k beyond first time limit as in Timer
+    iter_runtimes = [[round(t, 4) if t < iteration_passes[0][0] else "TL" for t in runtimes]]
+    best_solution = _set_iter_results(best_solution, solutions, iter_runtimes)
+    if config['telemetry']:
+        best_solution['telemetry'] = telemetry
 
-    # Create model
-    model = gp.Model("Max_#Assets")
+    return best_solution
 
-    # Suppress output
-    model.setParam("OutputFlag", 0)
 
-    # Add decision variables
-    y = model.addVars(V, vtype=GRB.BINARY, name="y")
+def _init_iteration_worker(model_args, upper_bounds, incumbent):
+    """
+    Store model arguments, upper bounds and shared incumbent in iteration worker process
+    """
+    _worker_data['model_args'] = model_args
+    _worker_data['upper_bounds'] = upper_bounds
+    _worker_data['incumbent'] = incumbent
+    _worker_data['model_data'] = None
 
-    # Set objective function
-    obj_fn = gp.quicksum(y[i] for i in V)
-    model.setObjective(obj_fn, GRB.MAXIMIZE)
 
-    # Add constraints
-    model.addConstrs((y[i] + y[j] <= 1 for (i, j) in G2.edges), name="c1")
-    model.addConstr(obj_fn <= 1 / gamma, name="c2")
-    
-    # Solve
-    model.optimize()
-    
-    return int(sum(y[i].X for i in V))
+def _solve_iteration(k, opt_config):
+    """
+    Solve iteration k in worker process and return solution with its runtime, skipped if its upper
+    bound cannot improve shared incumbent
+    """
+    start_time = time.perf_counter()
+    upper_bound = _worker_data['upper_bounds'][k-1]
+    if upper_bound < _worker_data['incumbent'].value:
+        return {'solved': True, 'obj_bound': upper_bound, 'status': 'Inf-Ub'}, time.perf_counter() - start_time
+
+    # Build model once per worker process, its telemetry is sent with the first solve
+    built = _worker_data['model_data'] is None
+    if built:
+        _worker_data['model_data'] = _build_model(*_worker_data['model_args'])
+    config = _worker_data['model_args'][3]
 
+    solution = _solve_model(_worker_data['model_data'], config, opt_config, _worker_data['incumbent'])
+    if built and 'telemetry' in solution:
+        solution['telemetry']['build'] = _worker_data['model_data']['telemetry']
 
-def _solve_ub(instance, config, numOfselectedAssets):
+    return solution, time.perf_counter() - start_time
+
+
+def _solve_max_num_of_assets(G2, config):
     """
-    Calculate a simple upper bound on the objective value.
+    Solve maximum number of assets possible, an independent set of G2 with at most 1 / gamma assets
     """
-    # Unpack instance data
-    (assets, daily_returns, min_daily_return, mean_return,
-     correlation_matrix, sigma, asset_pairs, total_days) = instance
-    
+    return get_max_independent_set_size(G2, math.floor(1 / config['gamma']))
+
+
+def _solve_ubs(G2, cliques, instance, config, delta, max_num_of_assets):
+    """
+    Calculate upper bounds on the objective value for every number of selected assets in one pass,
+    selected assets form an independent set of G2 so at most one comes from each clique of a clique partition
+    """
+    mean_return = instance.mean_return
     gamma = config['gamma']
-    
-    # Assign largest weight to best asset and others set to gamma
-    top_k_indices = np.argsort(mean_return)[-numOfselectedAssets:]
-    top_k_returns = mean_return[top_k_indices]
-    weights = np.ones(numOfselectedAssets) * gamma
-    weights[-1] = 1 - gamma * (numOfselectedAssets - 1)  
+    upper_bounds = np.full(max_num_of_assets, float('-inf'))
+
+    # Best return of each clique, sorted once
+    clique_partition = get_clique_partition(G2, mean_return)
+    best_returns = np.sort([mean_return[c].max() for c in clique_partition])[::-1][:max_num_of_assets]
 
-    # The dot product gives the objective value for this ideal, unconstrained portfolio.
-    return weights.dot(top_k_returns)
+    # Assign largest weight to best clique and others set to gamma, -inf if fewer cliques than assets
+    if len(best_returns):
+        k = np.arange(1, len(best_returns)+1)
+        upper_bounds[:len(best_returns)] = (1 - gamma * (k-1)) * best_returns[0] + gamma * (np.cumsum(best_returns) - best_returns[0])
+
+    # Tighten with LP relaxation of model with exactly k assets
+    if config['lp_bound']:
+        form = get_model_form(G2, cliques, instance, config, delta)
+        for k in range(1, max_num_of_assets+1):
+            update_model_form(form, config, {'fix_assets': {'num': k, 'constr': 'equality'}})
+            upper_bounds[k-1] = min(upper_bounds[k-1], solve_form_relaxation(form))
+
+    return upper_bounds.tolist()
+
+
+def _get_initial_solution(start_solution):
+    """
+    Return start solution as best solution of iterations, solution of its number of assets
+    """
+    if not start_solution:
+        return {'obj_val': float('-inf')}
+
+    return {**start_solution, 'idx': len(start_solution['selected_idx'])}
 
 
 def _get_best_solution(best_solution, current_solution, k):
@@ -267,7 +493,7 @@ def _update_solutions(solution, solutions):
 
 
 
-def _set_iter_results(solution, solutions, timer):
+def _set_iter_results(solution, solutions, iter_runtimes):
     """
     Set iteration warmstart results to solution
     """
@@ -275,28 +501,9 @@ def _set_iter_results(solution, solutions, timer):
         'obj_vals': [d.get('obj_val', d['status']) for d in solutions],
         'obj_bounds': [d.get('obj_bound', d['status']) for d in solutions],
         'solved_iters': [d['solved'] for d in solutions],
-        'iter_runtimes': timer.runtimes_list,
+        'iter_runtimes': iter_runtimes,
         'best_idx': solution['idx']
     }
     solution['status'] = "Optimal" if all(solution['iter_results']['solved_iters']) else "Unsolved"
 
     return solution
-
-
-def _save_log(model, save_flag):
-    """
-    Save logfile of gurobi formulation for debbuging
-    """
-    if not save_flag:
-        # Disable all output
-        model.setParam('OutputFlag', 0)
-        return
-
-    folder_path = "application/logfiles"
-    date = datetime.now().strftime('%Y%m%d_%H%M%S')
-
-    # Create logfiles folder
-    os.makedirs(folder_path, exist_ok=True)
-    
-    # Save logfile
-    model.setParam("LogFile", folder_path + f"/gurobi_log_{date}.txt")
\ No newline at end of file